@@ -1,5 +1,13 @@
 import os
-from flask import Flask, request, jsonify
+import atexit
+import hashlib
+import itertools
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+import orjson
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -7,8 +15,15 @@ from dotenv import load_dotenv
 from config import DefaultConfig
 from utils.logger import CustomLogger
 from utils.database import FeedbackDatabase
-from utils.helpers import format_message_as_html, remove_html_tags
+from utils.helpers import (
+    CompiledPromptTemplate,
+    format_message_as_html,
+    prescreen_stock_query,
+    remove_html_tags,
+)
 from utils.stock_data import StockDataFetcher
+from utils.cache import TTLCache
+from utils.semantic_cache import SemanticCache
 from services.llm_service import LLMService
 
 # Initialize logger
@@ -26,6 +41,31 @@ DefaultConfig.initialise()
 config = DefaultConfig.bot_config
 logger.info("Configuration loaded successfully")
 
+# Prompt templates and model parameters are static after initialisation;
+# templates filled in per request are pre-parsed once here
+SYSTEM_PROMPT = config.get_prompt("system_prompt")
+PARSING_TEMPLATE = CompiledPromptTemplate(config.get_prompt("parsing_prompt_template"))
+SESSION_TITLE_TEMPLATE = CompiledPromptTemplate(config.get_prompt("session_title_prompt"))
+STOCK_EXTRACT_TEMPLATE = CompiledPromptTemplate(config.get_prompt("stock_symbol_extraction_prompt"))
+STOCK_FIN_TEMPLATE = CompiledPromptTemplate(config.get_prompt("stock_financial_prompt_template"))
+FINANCIAL_TEMPLATE = CompiledPromptTemplate(config.get_prompt("financial_prompt_template"))
+GENERAL_TEMPLATE = CompiledPromptTemplate(config.get_prompt("general_question_prompt"))
+SUMMARIZATION_PROMPT = config.get_prompt("summarization_prompt")
+DEFAULT_TEMP = config.get_model_config("temperature", 0.7)
+DEFAULT_MAXTOK = config.get_model_config("max_tokens", 2000)
+
+# Structured output schema for LLM stock symbol extraction
+STOCK_SYMBOLS_SCHEMA = {
+    "title": "stock_symbols",
+    "description": "Stock ticker symbols mentioned in a question",
+    "type": "object",
+    "properties": {
+        "symbols": {"type": "array", "items": {"type": "string"}},
+        "is_stock_query": {"type": "boolean"},
+    },
+    "required": ["symbols", "is_stock_query"],
+}
+
 # Initialize LLM Service (replaces Groq client)
 logger.info("Initializing LLM Service")
 try:
@@ -35,31 +75,180 @@ except Exception as e:
     logger.error(f"Failed to initialize LLM Service: {e}")
     raise
 
+# Initialize exact-match LLM response cache
+llm_cache = TTLCache(
+    max_size=config.get("cache.llm_max_entries", 2048),
+    ttl=config.get("cache.llm_ttl_seconds", 1800),
+)
+logger.info("LLM response cache initialized")
+
 # Initialize Flask app
 logger.info("Initializing Flask application")
 app = Flask(__name__)
 CORS(app)
 logger.info("Flask app initialized with CORS enabled")
 
+
+def ojsonify(data, status: int = 200) -> Response:
+    """jsonify replacement that serializes with orjson"""
+    return Response(orjson.dumps(data), status=status, mimetype="application/json")
+
+
+# Shared pool for overlapping blocking I/O (LLM and stock API calls) within a request
+io_workers = config.get("server.io_workers", 8)
+io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="chatbot-io")
+atexit.register(io_executor.shutdown, wait=False)
+logger.info(f"I/O executor initialized with {io_workers} workers")
+
+# Separate pool for fire-and-forget session summaries, so queued summary LLM calls
+# can't starve the per-request stock fetches and title generation above
+summary_workers = config.get("server.summary_workers", 2)
+summary_executor = ThreadPoolExecutor(
+    max_workers=summary_workers, thread_name_prefix="chatbot-summary"
+)
+atexit.register(summary_executor.shutdown, wait=False)
+
+# Longest a request waits for a new session's title before using the default
+TITLE_TIMEOUT = config.get("server.title_timeout_seconds", 10)
+
+# Largest pages accepted by GET /sessions?limit= and GET /sessions/<id>?limit=
+MAX_SESSIONS_PAGE_SIZE = 200
+MAX_MESSAGES_PAGE_SIZE = 500
+
+# Background conversation summaries: session_id -> (sequence, future) of the latest one
+SUMMARY_WAIT_TIMEOUT = config.get("server.summary_wait_seconds", 15)
+_summary_lock = threading.Lock()
+# Serializes the check-and-store of finished summaries without holding _summary_lock
+_summary_store_lock = threading.Lock()
+_summary_sequence = itertools.count()
+_pending_summaries = {}
+
 # Initialize database
 db_folder = os.path.join(os.path.dirname(__file__), config.get("database.folder", "data"))
 os.makedirs(db_folder, exist_ok=True)
 db_filename = config.get("database.path", "feedback.db")
 db_path = os.path.join(db_folder, db_filename)
 logger.info(f"Initializing feedback database at: {db_path}")
-feedback_db = FeedbackDatabase(db_path, logger)
+feedback_db = FeedbackDatabase(
+    db_path,
+    logger,
+    pool_size=config.get("database.pool_size", 8),
+    optimize_every_writes=config.get("database.optimize_every_writes", 1000),
+)
+atexit.register(feedback_db.close)
 logger.info("Feedback database initialized")
 
 # Initialize stock data fetcher
 logger.info("Initializing stock data fetcher")
-stock_fetcher = StockDataFetcher(logger)
+stock_fetcher = StockDataFetcher(logger, cache_ttl=config.get("stock_data.cache_ttl_seconds", 60))
+STOCK_FETCH_TIMEOUT = config.get("stock_data.fetch_timeout_seconds", 5)
+STOCK_PRESCREEN_ENABLED = config.get("stock_data.regex_prescreen", True)
 logger.info("Stock data fetcher initialized successfully")
 
-parsed_knowledge_base = ""  # This holds the parsed knowledge base content
+# Initialize semantic response cache (persisted on shutdown)
+semantic_cache = SemanticCache(config, logger)
+atexit.register(semantic_cache.save)
+
+
+def prewarm():
+    """
+    Open the LLM, stock API and database connections before the first request
+
+    The first call to each otherwise pays for DNS, the TLS handshake and a cold
+    SQLite page cache. Failures are logged and ignored.
+    """
+    logger.info("Pre-warming LLM, stock data and database connections")
+    try:
+        llm_service.warm_up()
+    except Exception as e:
+        logger.warning("LLM pre-warm failed: %s", e)
+    try:
+        stock_fetcher.format_stock_context("AAPL", include_historical=False)
+    except Exception as e:
+        logger.warning("Stock data pre-warm failed: %s", e)
+    feedback_db.warm_up()
+    logger.info("Pre-warm complete")
+
+
+# Set PREWARM=0 to skip (e.g. for local development without network access)
+if os.getenv("PREWARM", "1") == "1":
+    io_executor.submit(prewarm)
+
+
+def load_knowledge_base_prompt(path: str) -> str:
+    """
+    Read the knowledge base file and build the prompt section that embeds it
+
+    The prompt section is built once here instead of on every request.
+
+    Args:
+        path: Path to a UTF-8 text file
+
+    Returns:
+        Knowledge base prompt section, or "" if the file is missing or empty
+    """
+    if not os.path.isfile(path) or os.path.getsize(path) == 0:
+        logger.info("No knowledge base found at %s", path)
+        return ""
+
+    try:
+        with open(path, encoding="utf-8") as kb_file:
+            knowledge_base = kb_file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error("Failed to load knowledge base from %s: %s", path, e)
+        return ""
+
+    logger.info("Knowledge base loaded from %s (%d chars)", path, len(knowledge_base))
+    return f"Here is some knowledge that can help:\n{knowledge_base}\n\n"
+
+
+# Knowledge base prompt section, read-only after startup
+kb_path = os.path.join(
+    os.path.dirname(__file__), config.get("knowledge_base.path", "data/kb.txt")
+)
+KNOWLEDGE_BASE_PROMPT = load_knowledge_base_prompt(kb_path)
+
 logger.info("Backend initialization complete")
 logger.info("=" * 80)
 
 
+def cached_generate(prompt: str, temperature: float, max_tokens: int, schema: dict = None):
+    """
+    Call llm_service.generate, reusing a cached response for identical prompts
+
+    The cache key is a digest of the prompt plus the sampling parameters, so
+    only exact repeats are served from the cache. Empty responses are not cached.
+
+    Args:
+        prompt: Prompt to send to the LLM
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        schema: Optional JSON schema; when given, llm_service.generate_json is used
+
+    Returns:
+        Generated (or cached) text response, or a dictionary if schema is given
+    """
+    prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    key = (prompt_hash, temperature, max_tokens, schema["title"] if schema else None)
+
+    cached = llm_cache.get(key)
+    if cached is not None:
+        logger.debug("LLM cache hit (prompt hash: %s)", prompt_hash)
+        return cached
+
+    if schema:
+        response = llm_service.generate_json(
+            prompt=prompt, schema=schema, temperature=temperature, max_tokens=max_tokens
+        )
+    else:
+        response = llm_service.generate(
+            prompt=prompt, temperature=temperature, max_tokens=max_tokens
+        )
+    if response:
+        llm_cache.set(key, response)
+    return response
+
+
 def parse_content(content, parse_description):
     """
     Parse content using LLM and format as HTML
@@ -84,13 +273,12 @@ def parse_content(content, parse_description):
             logger.error("parse_content called with empty parse_description")
             raise ValueError("Parse description cannot be empty")
 
-        logger.info("=" * 60)
         logger.info("Starting LLM content parsing operation")
-        logger.info(f"Parse description: {parse_description}")
-        logger.info(f"Content length: {len(content)} characters")
+        logger.debug("Parse description: %s", parse_description)
+        logger.debug("Content length: %d characters", len(content))
 
         # Use prompt template from config
-        prompt_template = config.get_prompt("parsing_prompt_template")
+        prompt_template = PARSING_TEMPLATE
         if not prompt_template:
             # Fallback if not in config
             logger.warning("parsing_prompt_template not found in config, using fallback")
@@ -100,18 +288,17 @@ def parse_content(content, parse_description):
             \n\n{parse_description}
             """
         else:
-            logger.info("Using parsing_prompt_template from configuration")
+            logger.debug("Using parsing_prompt_template from configuration")
             input_prompt = prompt_template.format(
                 content=content, parse_description=parse_description
             )
 
-        logger.info("Calling LLM API for content parsing")
-        logger.info(f"Input prompt length: {len(input_prompt)} characters")
+        logger.debug("Calling LLM API for content parsing (prompt length: %d)", len(input_prompt))
 
-        parsed_content = llm_service.generate(
+        parsed_content = cached_generate(
             prompt=input_prompt,
-            temperature=config.get_model_config("temperature", 0.7),
-            max_tokens=config.get_model_config("max_tokens", 2000),
+            temperature=DEFAULT_TEMP,
+            max_tokens=DEFAULT_MAXTOK,
         )
 
         if not parsed_content:
@@ -119,21 +306,18 @@ def parse_content(content, parse_description):
             return content  # Return original content as fallback
 
         logger.info(
-            f"Parsing completed successfully, output length: {len(parsed_content)} characters"
+            "Parsing completed successfully, output length: %d characters", len(parsed_content)
         )
-        logger.info("=" * 60)
         return parsed_content
 
     except ValueError as ve:
-        logger.error(f"Validation error in parse_content: {ve}")
+        logger.error("Validation error in parse_content: %s", ve)
         raise
     except Exception as e:
-        logger.error("=" * 60)
-        logger.error(f"Critical error parsing content: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Parse description was: {parse_description}")
-        logger.error(f"Content length was: {len(content) if content else 0}")
-        logger.error("=" * 60)
+        logger.error("Critical error parsing content: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Parse description was: %s", parse_description)
+        logger.error("Content length was: %d", len(content) if content else 0)
         return f"Error parsing content: {str(e)}"
 
 
@@ -157,12 +341,12 @@ def generate_session_title(question: str) -> str:
             logger.error("generate_session_title called with empty question")
             raise ValueError("Question cannot be empty")
 
-        logger.info("=" * 60)
         logger.info("Generating session title from first question")
-        logger.info(f"Question: '{question[:100]}...' (length: {len(question)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Question: '%s...' (length: %d)", question[:100], len(question))
 
         # Use prompt from config
-        prompt_template = config.get_prompt("session_title_prompt")
+        prompt_template = SESSION_TITLE_TEMPLATE
         if not prompt_template:
             # Fallback prompt if not in config
             logger.warning("session_title_prompt not found in config, using fallback")
@@ -173,12 +357,12 @@ Question: {question}
 
 Title:"""
         else:
-            logger.info("Using session_title_prompt from configuration")
+            logger.debug("Using session_title_prompt from configuration")
 
         prompt = prompt_template.format(question=question)
 
-        logger.info("Calling LLM API for title generation")
-        title = llm_service.generate(prompt=prompt, temperature=0.5, max_tokens=30)
+        logger.debug("Calling LLM API for title generation")
+        title = cached_generate(prompt=prompt, temperature=0.5, max_tokens=30)
 
         if not title:
             logger.warning("LLM returned empty title, using fallback")
@@ -190,24 +374,21 @@ Title:"""
             # Truncate to 50 chars
             title = title[:50]
 
-        logger.info(f"Generated title: '{title}'")
-        logger.info("=" * 60)
+        logger.info("Generated title: '%s'", title)
         return title
 
     except ValueError as ve:
-        logger.error(f"Validation error in generate_session_title: {ve}")
+        logger.error("Validation error in generate_session_title: %s", ve)
         raise
     except Exception as e:
-        logger.error("=" * 60)
-        logger.error(f"Error generating session title: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Question was: '{question[:100] if question else 'None'}...'")
-        logger.error("=" * 60)
+        logger.error("Error generating session title: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Question was: '%s...'", question[:100] if question else "None")
         # Fallback: use first few words of question
         if question:
             words = question.split()[:5]
             fallback_title = " ".join(words)[:50]
-            logger.info(f"Using fallback title: '{fallback_title}'")
+            logger.info("Using fallback title: '%s'", fallback_title)
             return fallback_title
         return "New Chat Session"
 
@@ -231,335 +412,529 @@ def extract_stock_symbols(question):
             logger.error("extract_stock_symbols called with empty question")
             raise ValueError("Question cannot be empty")
 
-        logger.info("=" * 60)
-        logger.info(f"Extracting stock symbols from question: '{question[:100]}...'")
-        logger.info(f"Question length: {len(question)} characters")
-
-        prompt = config.get_prompt("stock_symbol_extraction_prompt")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracting stock symbols from question: '%s...'", question[:100])
+            logger.debug("Question length: %d characters", len(question))
+
+        # Skip the LLM call when a regex pre-screen already decides the question
+        if STOCK_PRESCREEN_ENABLED:
+            may_be_stock_query, explicit_symbols = prescreen_stock_query(question)
+            if explicit_symbols:
+                logger.info("Explicit symbols found, skipping LLM extraction: %s", explicit_symbols)
+                return explicit_symbols, True
+            if not may_be_stock_query:
+                logger.debug("No stock hints in question, skipping LLM extraction")
+                return [], False
+
+        prompt = STOCK_EXTRACT_TEMPLATE
         if not prompt:
             logger.warning("Stock symbol extraction prompt not found in config")
             logger.warning("Stock detection disabled - returning empty results")
-            logger.info("=" * 60)
             return [], False
 
-        logger.info("Using stock_symbol_extraction_prompt from configuration")
         formatted_prompt = prompt.format(question=question)
-        logger.info("Formatted extraction prompt created")
-        logger.info(f"Prompt length: {len(formatted_prompt)} characters")
-
-        logger.info("Calling LLM API for symbol extraction with temperature=0.3")
-        result_text = llm_service.generate(
+        logger.debug(
+            "Calling LLM API for symbol extraction (prompt length: %d)", len(formatted_prompt)
+        )
+        result = cached_generate(
             prompt=formatted_prompt,
             temperature=0.3,  # Low temperature for consistent extraction
             max_tokens=200,
+            schema=STOCK_SYMBOLS_SCHEMA,
         )
 
-        logger.info(f"Symbol extraction raw response: {result_text}")
-        logger.info(f"Response length: {len(result_text)} characters")
-
-        # Parse JSON response
-        import json
-
-        # Try to find JSON in the response
-        if "{" in result_text and "}" in result_text:
-            json_start = result_text.find("{")
-            json_end = result_text.rfind("}") + 1
-            json_str = result_text[json_start:json_end]
-            logger.info(f"Extracted JSON string: {json_str}")
+        logger.debug("Symbol extraction structured response: %s", result)
 
-            result = json.loads(json_str)
+        symbols = result.get("symbols", [])
+        is_stock_query = result.get("is_stock_query", False)
 
-            symbols = result.get("symbols", [])
-            is_stock_query = result.get("is_stock_query", False)
+        # Validate symbols is a list
+        if not isinstance(symbols, list):
+            logger.warning("symbols is not a list: %s, converting to list", type(symbols))
+            symbols = [symbols] if symbols else []
 
-            # Validate symbols is a list
-            if not isinstance(symbols, list):
-                logger.warning(f"symbols is not a list: {type(symbols)}, converting to list")
-                symbols = [symbols] if symbols else []
+        # Validate is_stock_query is boolean
+        if not isinstance(is_stock_query, bool):
+            logger.warning("is_stock_query is not boolean: %s, converting", type(is_stock_query))
+            is_stock_query = bool(is_stock_query)
 
-            # Validate is_stock_query is boolean
-            if not isinstance(is_stock_query, bool):
-                logger.warning(f"is_stock_query is not boolean: {type(is_stock_query)}, converting")
-                is_stock_query = bool(is_stock_query)
-
-            logger.info(
-                f"Successfully extracted - symbols: {symbols}, is_stock_query: {is_stock_query}"
-            )
-            logger.info("=" * 60)
-            return symbols, is_stock_query
-        else:
-            logger.warning(f"No JSON found in LLM response: {result_text}")
-            logger.info("=" * 60)
-            return [], False
+        logger.info(
+            "Successfully extracted - symbols: %s, is_stock_query: %s", symbols, is_stock_query
+        )
+        return symbols, is_stock_query
 
     except ValueError as ve:
-        logger.error("=" * 60)
-        logger.error(f"Validation error in extract_stock_symbols: {ve}")
-        logger.error("=" * 60)
+        logger.error("Validation error in extract_stock_symbols: %s", ve)
         raise
-    except json.JSONDecodeError as e:
-        logger.error("=" * 60)
-        logger.error(f"JSON decode error in symbol extraction: {e}")
-        logger.error(f"Problematic text: {result_text}")
-        logger.error("=" * 60)
-        return [], False
     except Exception as e:
-        logger.error("=" * 60)
-        logger.error(f"Unexpected error extracting stock symbols: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Question was: {question[:200] if question else 'None'}")
-        logger.error("=" * 60)
+        logger.error("Unexpected error extracting stock symbols: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Question was: %s", question[:200] if question else "None")
         return [], False
 
 
-# Endpoint to ask a question using the knowledge base
-@app.route("/ask", methods=["POST"])
-def ask_question():
+def build_answer_prompt(question: str, history: str):
     """
-    Main endpoint for question answering with stock data support
+    Build the answer prompt, enriching it with real-time stock data when relevant
 
-    Expected JSON:
-        question (str): User's question
-        history (str): Conversation history (optional)
-        session_id (str): Session identifier (optional)
+    Args:
+        question: User's question
+        history: Summarized conversation history (may be empty)
 
     Returns:
-        JSON with answer, history, and stock symbols
+        tuple: (prompt, system prompt, list of symbols, is_stock_query boolean)
     """
-    global parsed_knowledge_base
-
-    logger.info("=" * 80)
-    logger.info("Received POST request to /ask endpoint")
-    logger.info(f"Request time: {__import__('datetime').datetime.now()}")
+    knowledge_base_prompt = KNOWLEDGE_BASE_PROMPT
 
+    # Extract stock symbols from the question
     try:
-        # Extract and validate request data
-        if not request.json:
-            logger.error("Request body is empty or not JSON")
-            return jsonify({"error": "Request body must be JSON"}), 400
+        symbols, is_stock_query = extract_stock_symbols(question)
+    except Exception as e:
+        logger.error("Stock symbol extraction failed: %s", e)
+        logger.warning("Continuing without stock data")
+        symbols, is_stock_query = [], False
 
-        question = request.json.get("question")
-        history = request.json.get("history", "")
-        session_id = request.json.get("session_id")  # Get session ID if provided
+    stock_context = ""
 
-        logger.info(
-            f"Question received: '{question[:100] if question else 'None'}...' (length: {len(question) if question else 0})"
-        )
-        logger.info(f"History length: {len(history)} chars")
-        logger.info(f"Session ID: {session_id if session_id else 'None'}")
-
-        # Validate question
-        if not question:
-            logger.error("Question parameter missing from request")
-            logger.info("=" * 80)
-            return jsonify({"error": "Question is required"}), 400
-
-        if not question.strip():
-            logger.error("Question parameter is empty or whitespace only")
-            logger.info("=" * 80)
-            return jsonify({"error": "Question cannot be empty"}), 400
-
-        # Check if the knowledge base is empty or not
-        if parsed_knowledge_base:
-            knowledge_base_prompt = (
-                f"Here is some knowledge that can help:\n{parsed_knowledge_base}\n\n"
-            )
-            logger.info(f"Using knowledge base (length: {len(parsed_knowledge_base)} chars)")
-        else:
-            knowledge_base_prompt = ""
-            logger.info("No knowledge base available")
+    # Fetch real-time stock data if this is a stock query
+    if is_stock_query and symbols:
+        stock_data_parts = []
 
-        # Extract stock symbols from the question
-        logger.info("Starting stock symbol extraction process")
-        try:
-            symbols, is_stock_query = extract_stock_symbols(question)
-            logger.info(
-                f"Stock extraction result - symbols: {symbols}, is_stock_query: {is_stock_query}"
+        # Fetch all symbols concurrently; the timeout bounds the whole batch
+        logger.info("Fetching stock data for %d symbols in parallel", len(symbols))
+        futures = {
+            symbol: io_executor.submit(
+                stock_fetcher.format_stock_context, symbol, include_historical=True
             )
-        except Exception as e:
-            logger.error(f"Stock symbol extraction failed: {e}")
-            logger.warning("Continuing without stock data")
-            symbols, is_stock_query = [], False
-
-        stock_context = ""
-
-        # Fetch real-time stock data if this is a stock query
-        if is_stock_query and symbols:
-            logger.info(f"Stock query detected - symbols: {symbols}")
-            stock_data_parts = []
+            for symbol in symbols
+        }
+        wait(futures.values(), timeout=STOCK_FETCH_TIMEOUT)
 
-            for symbol in symbols:
-                try:
-                    logger.info(f"Fetching stock data for symbol: {symbol}")
-                    stock_info_str = stock_fetcher.format_stock_context(
-                        symbol, include_historical=True
-                    )
-                    if stock_info_str and "Unable to fetch" not in stock_info_str:
-                        stock_data_parts.append(stock_info_str)
-                        logger.info(f"Successfully fetched data for {symbol}")
-                    else:
-                        logger.warning(f"Could not fetch data for symbol: {symbol}")
-                except Exception as e:
-                    logger.error(f"Error fetching data for {symbol}: {e}")
-                    continue
-
-            if stock_data_parts:
-                stock_context = "\n\n".join(stock_data_parts)
-                logger.info(
-                    f"Stock context compiled for {len(stock_data_parts)} symbols (length: {len(stock_context)} chars)"
+        for symbol, future in futures.items():
+            if not future.done():
+                future.cancel()
+                logger.warning(
+                    "Timed out fetching data for %s after %ss", symbol, STOCK_FETCH_TIMEOUT
                 )
-            else:
-                logger.warning("No stock data could be fetched for any symbol")
+                continue
+            try:
+                stock_info_str = future.result()
+                if stock_info_str and "Unable to fetch" not in stock_info_str:
+                    stock_data_parts.append(stock_info_str)
+                    logger.debug("Successfully fetched data for %s", symbol)
+                else:
+                    logger.warning("Could not fetch data for symbol: %s", symbol)
+            except Exception as e:
+                logger.error("Error fetching data for %s: %s", symbol, e)
+                continue
+
+        if stock_data_parts:
+            stock_context = "\n\n".join(stock_data_parts)
+            logger.debug(
+                "Stock context compiled for %d symbols (length: %d chars)",
+                len(stock_data_parts),
+                len(stock_context),
+            )
         else:
-            logger.info(f"Not a stock query (is_stock_query={is_stock_query}, symbols={symbols})")
-
-        # Standard single response generation
-        logger.info("Using standard response generation")
-        system_prompt = config.get_prompt("system_prompt")
-        logger.info("Building prompt for response generation")
-
-        # Build prompt - use stock-specific prompt if we have stock data
-        if stock_context:
-            logger.info("Building stock-specific prompt")
-            prompt_template = config.get_prompt("stock_financial_prompt_template")
-            if not prompt_template:
-                # Fallback to regular financial prompt
-                logger.info("Stock template not found, using fallback financial prompt")
-                prompt_template = config.get_prompt("financial_prompt_template")
-                prompt = prompt_template.format(
-                    knowledge_base_prompt=f"{knowledge_base_prompt}\n\nREAL-TIME STOCK DATA:\n{stock_context}",
-                    history=history,
-                    question=question,
-                )
-            else:
-                prompt = prompt_template.format(
-                    stock_context=stock_context,
-                    knowledge_base_prompt=knowledge_base_prompt,
-                    history=history,
-                    question=question,
-                )
-        elif not history:
-            logger.info("Building general question prompt (no history)")
-            prompt_template = config.get_prompt("general_question_prompt")
-            prompt = prompt_template.format(question=question)
+            logger.warning("No stock data could be fetched for any symbol")
+
+    system_prompt = SYSTEM_PROMPT
+
+    # Build prompt - use stock-specific prompt if we have stock data
+    if stock_context:
+        logger.debug("Building stock-specific prompt")
+        prompt_template = STOCK_FIN_TEMPLATE
+        if not prompt_template:
+            # Fallback to regular financial prompt
+            logger.warning("Stock template not found, using fallback financial prompt")
+            prompt_template = FINANCIAL_TEMPLATE
+            prompt = prompt_template.format(
+                knowledge_base_prompt=f"{knowledge_base_prompt}\n\nREAL-TIME STOCK DATA:\n{stock_context}",
+                history=history,
+                question=question,
+            )
         else:
-            logger.info("Building financial prompt with history")
-            prompt_template = config.get_prompt("financial_prompt_template")
             prompt = prompt_template.format(
+                stock_context=stock_context,
                 knowledge_base_prompt=knowledge_base_prompt,
                 history=history,
                 question=question,
             )
+    elif not history:
+        logger.debug("Building general question prompt (no history)")
+        prompt_template = GENERAL_TEMPLATE
+        prompt = prompt_template.format(question=question)
+    else:
+        logger.debug("Building financial prompt with history")
+        prompt_template = FINANCIAL_TEMPLATE
+        prompt = prompt_template.format(
+            knowledge_base_prompt=knowledge_base_prompt,
+            history=history,
+            question=question,
+        )
 
-        logger.info("Calling LLM API for response generation")
-        answer = llm_service.generate(prompt=prompt, system_prompt=system_prompt)
+    return prompt, system_prompt, symbols, is_stock_query
 
-        logger.info(f"Standard response generated successfully (length: {len(answer)} chars)")
 
-        # Format the answer as HTML with line breaks and bullet points
-        logger.info("Formatting answer as HTML")
-        try:
-            formatted_answer = format_message_as_html(answer)
-            logger.info(f"Answer formatted successfully (length: {len(formatted_answer)} chars)")
-        except Exception as e:
-            logger.error(f"Error formatting answer: {e}")
-            logger.warning("Using unformatted answer")
-            formatted_answer = answer
+def format_answer(answer: str) -> str:
+    """Format the answer as HTML, falling back to the raw text on error"""
+    try:
+        return format_message_as_html(answer)
+    except Exception as e:
+        logger.error("Error formatting answer: %s", e)
+        logger.warning("Using unformatted answer")
+        return answer
+
+
+def generate_answer(question: str, history: str):
+    """
+    Generate an HTML-formatted answer, enriching the prompt with stock data
+
+    Args:
+        question: User's question
+        history: Summarized conversation history (may be empty)
+
+    Returns:
+        tuple: (formatted answer, list of symbols, is_stock_query boolean)
+    """
+    prompt, system_prompt, symbols, is_stock_query = build_answer_prompt(question, history)
+
+    answer = llm_service.generate(prompt=prompt, system_prompt=system_prompt)
+    logger.info("Response generated (length: %d chars)", len(answer))
+
+    return format_answer(answer), symbols, is_stock_query
+
+
+def parse_ask_request():
+    """
+    Extract and validate the JSON body shared by /ask and /ask-stream
+
+    Returns:
+        tuple: ((question, history, session_id), None) for a valid request,
+        or (None, error response) otherwise
+    """
+    if not request.json:
+        logger.error("Request body is empty or not JSON")
+        return None, ojsonify({"error": "Request body must be JSON"}, 400)
+
+    question = request.json.get("question")
+    history = request.json.get("history", "")
+    session_id = request.json.get("session_id")  # Get session ID if provided
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Question received: '%s...' (length: %d)",
+            question[:100] if question else "None",
+            len(question) if question else 0,
+        )
+        logger.debug("History length: %d chars", len(history))
+    logger.info("Session ID: %s", session_id)
+
+    # Validate question
+    if not question:
+        logger.error("Question parameter missing from request")
+        return None, ojsonify({"error": "Question is required"}, 400)
+
+    if not question.strip():
+        logger.error("Question parameter is empty or whitespace only")
+        return None, ojsonify({"error": "Question cannot be empty"}, 400)
+
+    return (question, history, session_id), None
+
+
+def start_session_turn(session_id, question, history):
+    """
+    Look up the session before answering
+
+    For a new session the title is generated concurrently with the answer;
+    for an existing one the stored summary replaces the client-sent history.
+
+    Returns:
+        tuple: (session dict or None, title future or None, history to use)
+    """
+    session = None
+    title_future = None
+    if session_id:
+        session = feedback_db.get_session(session_id)
+        if not session:
+            logger.info("New session - generating title in background")
+            title_future = io_executor.submit(generate_session_title, question)
+        else:
+            # The server-side summary includes the previous turn, prefer it
+            stored_summary = get_session_summary(session_id)
+            if stored_summary:
+                logger.debug("Using stored session summary (%d chars)", len(stored_summary))
+                history = stored_summary
+    return session, title_future, history
 
-        # Update and summarize conversation history
-        logger.info("Updating and summarizing conversation history")
+
+def update_history(history, question, formatted_answer, session_id, question_embedding, is_stock_query):
+    """
+    Build the summarized history returned to the client and cache the answer
+
+    Returns:
+        tuple: (summarized history, full updated history)
+    """
+    updated_history = "".join((history, "\nHuman: ", question, "\nAI: ", formatted_answer))
+
+    if session_id:
+        # Reply with the truncated history right away; the LLM summary is
+        # generated in the background and stored on the session
+        summarized_history = updated_history[-1000:]
+    else:
         try:
-            updated_history = f"{history}\nHuman: {question}\nAI: {formatted_answer}"
             summarized_history = summarize_conversation(updated_history)
-            logger.info(
-                f"History summarized successfully (length: {len(summarized_history)} chars)"
+            logger.debug(
+                "History summarized successfully (length: %d chars)", len(summarized_history)
             )
         except Exception as e:
-            logger.error(f"Error summarizing history: {e}")
+            logger.error("Error summarizing history: %s", e)
             logger.warning("Using truncated history as fallback")
             # Fallback: use last 1000 chars of updated history
-            updated_history = f"{history}\nHuman: {question}\nAI: {formatted_answer}"
-            summarized_history = (
-                updated_history[-1000:] if len(updated_history) > 1000 else updated_history
-            )
+            summarized_history = updated_history[-1000:]
 
-        # Handle session management
-        is_new_session = False
-        if session_id:
+    # Stock answers embed live prices, so only cache general questions
+    if question_embedding is not None and not is_stock_query:
+        semantic_cache.add(
+            question_embedding,
+            {"answer": formatted_answer, "summarized_history": summarized_history},
+        )
+
+    return summarized_history, updated_history
+
+
+def save_session_turn(session_id, session, title_future, question, formatted_answer, updated_history):
+    """
+    Persist a question/answer pair, creating the session on its first message
+
+    Returns:
+        The session dictionary if it was created by this call, None otherwise
+    """
+    if not session_id:
+        logger.debug("No session ID provided, skipping session management")
+        return None
+
+    new_session = None
+    try:
+        if not session:
+            # Create new session with the title generated alongside the answer
             try:
-                logger.info(f"Managing session: {session_id}")
-                # Check if this is a new session (first message)
-                session = feedback_db.get_session(session_id)
-                if not session:
-                    # Create new session with generated title
-                    logger.info("Creating new session")
-                    try:
-                        title = generate_session_title(question)
-                    except Exception as e:
-                        logger.error(f"Failed to generate session title: {e}")
-                        title = "New Chat"
-
-                    feedback_db.create_session(session_id, title)
-                    is_new_session = True
-                    logger.info(f"New session created with title: '{title}'")
-                else:
-                    logger.info(f"Existing session found: '{session.get('title', 'Untitled')}'")
-
-                # Save user message
-                feedback_db.save_message(session_id, "user", question, rl_used=False)
-                # Save assistant message
-                feedback_db.save_message(
-                    session_id,
-                    "assistant",
-                    formatted_answer,
-                    rl_used=False,
-                )
-                logger.info(f"Messages saved to session {session_id}")
+                title = title_future.result(timeout=TITLE_TIMEOUT)
+            except FutureTimeoutError:
+                title_future.cancel()
+                logger.warning("Session title not ready after %ss, using default", TITLE_TIMEOUT)
+                title = "New Chat"
             except Exception as e:
-                logger.error(f"Error in session management: {e}")
-                logger.error(f"Error type: {type(e).__name__}")
-                logger.warning("Continuing without session persistence")
+                logger.error("Failed to generate session title: %s", e)
+                title = "New Chat"
+
+        # Create the session (if needed) and save both messages with one commit;
+        # a failed write raises inside the block and rolls back the whole turn
+        with feedback_db.transaction():
+            created_session = None
+            if not session:
+                created_session = feedback_db.create_session(session_id, title)
+
+            saved = feedback_db.save_messages(
+                [
+                    (session_id, "user", question, False),
+                    (session_id, "assistant", formatted_answer, False),
+                ]
+            )
+            if not saved:
+                raise RuntimeError(f"Failed to save messages to session {session_id}")
+
+        if created_session:
+            new_session = created_session
+            logger.info("New session created with title: '%s'", title)
+        logger.debug("Messages saved to session %s", session_id)
+
+        # Summarize off the request path now that the session row exists
+        if updated_history is not None:
+            schedule_session_summary(session_id, updated_history)
+    except Exception as e:
+        logger.error("Error in session management: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.warning("Continuing without session persistence")
+
+    return new_session
+
+
+def build_ask_response(formatted_answer, summarized_history, symbols, is_stock_query, new_session):
+    """Assemble the response payload shared by /ask and /ask-stream"""
+    response_data = {
+        "answer": formatted_answer,
+        "summarized_history": summarized_history,
+        "rl_used": False,
+        "stock_symbols": symbols if is_stock_query and symbols else [],
+    }
+
+    if new_session:
+        # Return session info for new sessions
+        response_data["session"] = new_session
+
+    return response_data
+
+
+# Endpoint to ask a question using the knowledge base
+@app.route("/ask", methods=["POST"])
+def ask_question():
+    """
+    Main endpoint for question answering with stock data support
+
+    Expected JSON:
+        question (str): User's question
+        history (str): Conversation history (optional)
+        session_id (str): Session identifier (optional)
+
+    Returns:
+        JSON with answer, history, and stock symbols
+    """
+    logger.info("Received POST request to /ask endpoint")
+
+    try:
+        # Extract and validate request data
+        parsed, error_response = parse_ask_request()
+        if error_response:
+            return error_response
+        question, history, session_id = parsed
+
+        session, title_future, history = start_session_turn(session_id, question, history)
+
+        # Serve paraphrases of earlier standalone questions from the semantic cache.
+        # Follow-up questions depend on history, so they always go to the LLM.
+        question_embedding = semantic_cache.embed(question) if not history else None
+        cached_response = semantic_cache.lookup(question_embedding)
+        updated_history = None
+
+        if cached_response:
+            logger.info("Using semantic cache response")
+            formatted_answer = cached_response["answer"]
+            summarized_history = cached_response["summarized_history"]
+            symbols, is_stock_query = [], False
         else:
-            logger.info("No session ID provided, skipping session management")
+            formatted_answer, symbols, is_stock_query = generate_answer(question, history)
+            summarized_history, updated_history = update_history(
+                history, question, formatted_answer, session_id, question_embedding, is_stock_query
+            )
+
+        # Handle session management
+        new_session = save_session_turn(
+            session_id, session, title_future, question, formatted_answer, updated_history
+        )
+
+        response_data = build_ask_response(
+            formatted_answer, summarized_history, symbols, is_stock_query, new_session
+        )
 
         logger.info("Successfully processed /ask request")
-        logger.info("=" * 80)
+        return ojsonify(response_data, 200)
 
-        response_data = {
-            "answer": formatted_answer,
-            "summarized_history": summarized_history,
-            "rl_used": False,
-            "stock_symbols": symbols if is_stock_query and symbols else [],
-        }
+    except ValueError as ve:
+        logger.error("Validation error in /ask endpoint: %s", ve)
+        return ojsonify({"error": f"Invalid input: {str(ve)}"}, 400)
+    except Exception as e:
+        logger.error("Critical error in /ask endpoint: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Traceback: %s", traceback.format_exc())
+        return ojsonify({"error": f"Internal server error: {str(e)}"}, 500)
 
-        if is_new_session and session_id:
+
+def format_sse_event(data: dict) -> str:
+    """Serialize a payload as a Server-Sent Events message"""
+    return f"data: {orjson.dumps(data).decode()}\n\n"
+
+
+@app.route("/ask-stream", methods=["POST"])
+def ask_question_stream():
+    """
+    Streaming variant of /ask using Server-Sent Events
+
+    Expected JSON: same as /ask
+
+    Returns:
+        text/event-stream of {"delta": str} events while the answer is generated,
+        followed by a final {"done": true, ...} event with the same fields /ask returns
+    """
+    logger.info("Received POST request to /ask-stream endpoint")
+
+    try:
+        parsed, error_response = parse_ask_request()
+        if error_response:
+            return error_response
+        question, history, session_id = parsed
+
+        session, title_future, history = start_session_turn(session_id, question, history)
+
+        question_embedding = semantic_cache.embed(question) if not history else None
+        cached_response = semantic_cache.lookup(question_embedding)
+
+        # Prompt building (symbol extraction, stock data) happens before the stream
+        # opens, so failures there still get a regular JSON error response
+        if not cached_response:
+            prompt, system_prompt, symbols, is_stock_query = build_answer_prompt(
+                question, history
+            )
+
+        def generate_events():
             try:
-                # Return session info for new sessions
-                session = feedback_db.get_session(session_id)
-                if session:
-                    response_data["session"] = session
-                    logger.info("Session info added to response")
-            except Exception as e:
-                logger.error(f"Error retrieving session info: {e}")
+                if cached_response:
+                    logger.info("Using semantic cache response")
+                    formatted_answer = cached_response["answer"]
+                    summarized_history = cached_response["summarized_history"]
+                    answer_symbols, answer_is_stock_query = [], False
+                    updated_history = None
+                    # Deltas carry raw text; format_answer only turned newlines into <br>
+                    yield format_sse_event({"delta": formatted_answer.replace("<br>", "\n")})
+                else:
+                    chunks = []
+                    for chunk in llm_service.stream(prompt=prompt, system_prompt=system_prompt):
+                        chunks.append(chunk)
+                        yield format_sse_event({"delta": chunk})
+
+                    answer = "".join(chunks)
+                    logger.info("Streamed response complete (length: %d chars)", len(answer))
+                    formatted_answer = format_answer(answer)
+                    answer_symbols, answer_is_stock_query = symbols, is_stock_query
+                    summarized_history, updated_history = update_history(
+                        history,
+                        question,
+                        formatted_answer,
+                        session_id,
+                        question_embedding,
+                        is_stock_query,
+                    )
 
-        logger.info("Response data prepared successfully")
-        return jsonify(response_data), 200
+                new_session = save_session_turn(
+                    session_id, session, title_future, question, formatted_answer, updated_history
+                )
+                response_data = build_ask_response(
+                    formatted_answer,
+                    summarized_history,
+                    answer_symbols,
+                    answer_is_stock_query,
+                    new_session,
+                )
+                response_data["done"] = True
 
-    except ValueError as ve:
-        logger.error("=" * 80)
-        logger.error(f"Validation error in /ask endpoint: {str(ve)}")
-        logger.error(f"Error type: {type(ve).__name__}")
-        logger.error("=" * 80)
-        return jsonify({"error": f"Invalid input: {str(ve)}"}), 400
-    except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"Critical error in /ask endpoint: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        import traceback
+                logger.info("Successfully processed /ask-stream request")
+                yield format_sse_event(response_data)
 
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        logger.error("=" * 80)
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+            except Exception as e:
+                logger.error("Error while streaming /ask-stream response: %s", e)
+                logger.error("Error type: %s", type(e).__name__)
+                yield format_sse_event({"error": f"Internal server error: {str(e)}"})
+
+        return Response(
+            stream_with_context(generate_events()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    except Exception as e:
+        logger.error("Critical error in /ask-stream endpoint: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        return ojsonify({"error": f"Internal server error: {str(e)}"}, 500)
 
 
 # Function to summarize conversation using LLM API
@@ -584,33 +959,28 @@ def summarize_conversation(conversation, max_tokens=1000):
             logger.warning("summarize_conversation called with empty conversation")
             return ""
 
-        logger.info("=" * 60)
         logger.info("Starting conversation summarization")
-        logger.info(f"Input conversation length: {len(conversation)} chars")
-        logger.info(f"Max tokens: {max_tokens}")
+        logger.debug(
+            "Input conversation length: %d chars, max tokens: %d", len(conversation), max_tokens
+        )
 
         # Remove any HTML tags from the conversation
         cleaned_conversation = remove_html_tags(conversation)
-        logger.info(f"Cleaned conversation length: {len(cleaned_conversation)} chars")
+        logger.debug("Cleaned conversation length: %d chars", len(cleaned_conversation))
 
         if not cleaned_conversation or not cleaned_conversation.strip():
             logger.warning("Conversation is empty after cleaning HTML tags")
-            logger.info("=" * 60)
             return ""
 
         # Get configuration
-        summarization_prompt = config.get_prompt("summarization_prompt")
+        summarization_prompt = SUMMARIZATION_PROMPT
         if not summarization_prompt:
             logger.warning("summarization_prompt not found in config, using default")
             summarization_prompt = (
                 "You are a helpful assistant that summarizes conversations concisely."
             )
 
-        logger.info("Using summarization prompt from configuration")
-        logger.info(f"System prompt length: {len(summarization_prompt)} chars")
-
         # Generate summary without HTML tags
-        logger.info("Calling LLM API for summarization")
         summary = llm_service.generate(
             prompt=cleaned_conversation,
             system_prompt=summarization_prompt,
@@ -619,28 +989,104 @@ def summarize_conversation(conversation, max_tokens=1000):
 
         if not summary or not summary.strip():
             logger.warning("LLM returned empty summary, returning original cleaned conversation")
-            logger.info("=" * 60)
             return cleaned_conversation
 
-        logger.info(f"Summarization complete (output length: {len(summary)} chars)")
         logger.info(
-            f"Compression ratio: {len(summary)}/{len(cleaned_conversation)} = {(len(summary) / len(cleaned_conversation) * 100):.1f}%"
+            "Summarization complete (%d -> %d chars, %.1f%%)",
+            len(cleaned_conversation),
+            len(summary),
+            len(summary) / len(cleaned_conversation) * 100,
         )
-        logger.info("=" * 60)
         return summary
 
     except ValueError as ve:
-        logger.error("=" * 60)
-        logger.error(f"Validation error in summarize_conversation: {ve}")
-        logger.error("=" * 60)
+        logger.error("Validation error in summarize_conversation: %s", ve)
         return ""
     except Exception as e:
-        logger.error("=" * 60)
-        logger.error(f"Error summarizing conversation: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Conversation length was: {len(conversation) if conversation else 0} chars")
-        logger.error("=" * 60)
-        return "Error summarizing conversation"
+        logger.error("Error summarizing conversation: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Conversation length was: %d chars", len(conversation) if conversation else 0)
+        raise
+
+
+def _summarize_and_store(session_id, conversation, sequence):
+    """
+    Background task: summarize a session's conversation and store the result
+
+    The summary is only stored if no newer summarization has been scheduled
+    for the session in the meantime. If summarization fails, the truncated
+    conversation is stored instead so the latest exchange is not lost.
+    """
+    try:
+        summary = summarize_conversation(conversation)
+    except Exception as e:
+        logger.error("Background summarization failed for session %s: %s", session_id, e)
+        summary = ""
+
+    if not summary:
+        logger.warning("Using truncated history as fallback for session %s", session_id)
+        # Fallback: use last 1000 chars of the conversation, as the inline path does
+        summary = conversation[-1000:]
+
+    # The database write happens outside _summary_lock, which every /ask takes;
+    # _summary_store_lock keeps an older summary from overwriting a newer one
+    with _summary_store_lock:
+        with _summary_lock:
+            pending = _pending_summaries.get(session_id)
+            if pending is None or pending[0] != sequence:
+                logger.debug("Discarding superseded summary for session %s", session_id)
+                return
+        feedback_db.update_session_summary(session_id, summary)
+        logger.debug("Stored summary for session %s (%d chars)", session_id, len(summary))
+
+    with _summary_lock:
+        pending = _pending_summaries.get(session_id)
+        if pending is not None and pending[0] == sequence:
+            del _pending_summaries[session_id]
+
+
+def schedule_session_summary(session_id, conversation):
+    """
+    Summarize a session's conversation on the summary executor
+
+    Only the most recent summarization per session is kept; an older one that
+    finishes later is discarded.
+    """
+    with _summary_lock:
+        sequence = next(_summary_sequence)
+        _pending_summaries[session_id] = (sequence, None)
+
+    future = summary_executor.submit(_summarize_and_store, session_id, conversation, sequence)
+
+    with _summary_lock:
+        pending = _pending_summaries.get(session_id)
+        if pending is not None and pending[0] == sequence:
+            _pending_summaries[session_id] = (sequence, future)
+
+
+def get_session_summary(session_id):
+    """
+    Get the stored summary of a session, waiting for one still being generated
+
+    Returns:
+        Summary string, or None if the session has no summary yet or the pending
+        one did not finish in time (the stored row would miss the latest turn)
+    """
+    with _summary_lock:
+        pending = _pending_summaries.get(session_id)
+
+    if pending is not None and pending[1] is not None:
+        logger.debug("Waiting for pending summary of session %s", session_id)
+        done, _ = wait([pending[1]], timeout=SUMMARY_WAIT_TIMEOUT)
+        if not done:
+            logger.warning(
+                "Summary for session %s not ready after %ss, using client history",
+                session_id,
+                SUMMARY_WAIT_TIMEOUT,
+            )
+            return None
+
+    return feedback_db.get_session_summary(session_id)
 
 
 # RL Feedback Endpoints
@@ -658,7 +1104,6 @@ def submit_feedback():
     }
     """
     try:
-        logger.info("=" * 60)
         logger.info("Received POST request to /feedback endpoint")
 
         data = request.json
@@ -667,27 +1112,28 @@ def submit_feedback():
         rating = data.get("rating")
         session_id = data.get("session_id")
 
-        logger.info(f"Feedback data - Question length: {len(question) if question else 0}")
-        logger.info(f"Feedback data - Answer length: {len(answer) if answer else 0}")
-        logger.info(f"Feedback data - Rating: {rating}")
-        logger.info(f"Feedback data - Session ID: {session_id}")
+        logger.debug(
+            "Feedback data - Question length: %d, Answer length: %d",
+            len(question) if question else 0,
+            len(answer) if answer else 0,
+        )
+        logger.info("Feedback data - Rating: %s, Session ID: %s", rating, session_id)
 
         if not question or not answer or rating is None:
             logger.error("Missing required fields in feedback submission")
-            return jsonify({"error": "question, answer, and rating are required"}), 400
+            return ojsonify({"error": "question, answer, and rating are required"}, 400)
 
         # Validate rating
         try:
             rating_int = int(rating)
             if rating_int not in (0, 1):
-                logger.error(f"Invalid rating value: {rating_int} (must be 0 or 1)")
-                return jsonify({"error": "rating must be 0 (negative) or 1 (positive)"}), 400
+                logger.error("Invalid rating value: %d (must be 0 or 1)", rating_int)
+                return ojsonify({"error": "rating must be 0 (negative) or 1 (positive)"}, 400)
         except (ValueError, TypeError):
-            logger.error(f"Invalid rating type: {type(rating)}")
-            return jsonify({"error": "rating must be an integer (0 or 1)"}), 400
+            logger.error("Invalid rating type: %s", type(rating))
+            return ojsonify({"error": "rating must be an integer (0 or 1)"}, 400)
 
         # Save feedback to database
-        logger.info("Saving feedback to database")
         feedback_id = feedback_db.save_feedback(
             question=question,
             answer=answer,
@@ -695,24 +1141,21 @@ def submit_feedback():
             session_id=session_id,
         )
 
-        logger.info(f"Feedback saved successfully with ID: {feedback_id}")
-
-        logger.info("Feedback submission completed successfully")
-        logger.info("=" * 60)
+        logger.info("Feedback saved successfully with ID: %s", feedback_id)
 
-        return jsonify(
+        return ojsonify(
             {
                 "status": "success",
                 "feedback_id": feedback_id,
                 "message": "Feedback recorded successfully",
-            }
-        ), 200
+            },
+            200,
+        )
 
     except Exception as e:
-        logger.error(f"Error submitting feedback: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error("=" * 60)
-        return jsonify({"error": str(e)}), 500
+        logger.error("Error submitting feedback: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        return ojsonify({"error": str(e)}, 500)
 
 
 # Chat Session Management Endpoints
@@ -720,84 +1163,153 @@ def submit_feedback():
 
 @app.route("/sessions", methods=["GET"])
 def get_sessions():
-    """Get all chat sessions."""
+    """
+    Get chat sessions, most recent first.
+
+    Query parameters (optional):
+        limit (int): Page size, 1-200; all sessions are returned if omitted
+        before (str), before_id (str): Cursor from a previous page's next_before
+            and next_before_id
+
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
     try:
         logger.info("Received GET request to /sessions endpoint")
-        sessions = feedback_db.get_all_sessions()
-        logger.info(f"Returning {len(sessions)} sessions")
 
-        return jsonify({"sessions": sessions}), 200
+        limit = request.args.get("limit")
+        before = request.args.get("before")
+        before_id = request.args.get("before_id")
+
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return ojsonify({"error": "limit must be an integer"}, 400)
+            if not 1 <= limit <= MAX_SESSIONS_PAGE_SIZE:
+                return ojsonify(
+                    {"error": f"limit must be between 1 and {MAX_SESSIONS_PAGE_SIZE}"}, 400
+                )
+
+        # The list only changes when a session is created, touched or deleted
+        sessions_version = feedback_db.get_sessions_version()
+        etag = hashlib.blake2b(
+            repr((sessions_version, limit, before, before_id)).encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+
+        # Without a version the list can't be validated, so never answer 304
+        if sessions_version is not None and request.if_none_match.contains(etag):
+            logger.debug("Session list unchanged, returning 304")
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        sessions = feedback_db.get_all_sessions(limit=limit, before=before, before_id=before_id)
+        logger.debug("Returning %d sessions", len(sessions))
+
+        response_data = {"sessions": sessions}
+        if limit is not None and len(sessions) == limit:
+            response_data["next_before"] = sessions[-1]["updated_at"]
+            response_data["next_before_id"] = sessions[-1]["id"]
+
+        response = ojsonify(response_data)
+        if sessions_version is not None:
+            response.set_etag(etag)
+        # Let browsers keep the list but revalidate it on every request
+        response.headers["Cache-Control"] = "no-cache"
+        return response
 
     except Exception as e:
-        logger.error(f"Error retrieving sessions: {e}")
-        return jsonify({"error": str(e)}), 500
+        logger.error("Error retrieving sessions: %s", e)
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route("/sessions/<session_id>", methods=["GET"])
 def get_session(session_id):
-    """Get a specific session with all its messages."""
+    """
+    Get a specific session with its messages, oldest first.
+
+    Query parameters (optional):
+        limit (int): Page size, 1-500; all messages are returned if omitted
+        after_id (int): Cursor from a previous page's next_after_id
+    """
     try:
-        logger.info(f"Received GET request to /sessions/{session_id} endpoint")
+        logger.info("Received GET request to /sessions/%s endpoint", session_id)
+
+        limit = request.args.get("limit")
+
+        try:
+            after_id = int(request.args.get("after_id", 0))
+        except ValueError:
+            return ojsonify({"error": "after_id must be an integer"}, 400)
+
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return ojsonify({"error": "limit must be an integer"}, 400)
+            if not 1 <= limit <= MAX_MESSAGES_PAGE_SIZE:
+                return ojsonify(
+                    {"error": f"limit must be between 1 and {MAX_MESSAGES_PAGE_SIZE}"}, 400
+                )
 
         session = feedback_db.get_session(session_id)
         if not session:
-            return jsonify({"error": "Session not found"}), 404
-
-        messages = feedback_db.get_session_messages(session_id)
-
-        # Format messages for frontend
-        formatted_messages = []
-        for msg in messages:
-            formatted_messages.append(
-                {
-                    "role": msg["role"],
-                    "content": msg["content"],
-                    "timestamp": msg["timestamp"],
-                    "rlUsed": bool(msg["rl_used"]),
-                }
-            )
+            return ojsonify({"error": "Session not found"}, 404)
+
+        rows = feedback_db.get_session_message_rows(session_id, after_id=after_id, limit=limit)
+
+        # Build the frontend message shape straight from the row tuples
+        formatted_messages = [
+            {"role": role, "content": content, "timestamp": timestamp, "rlUsed": bool(rl_used)}
+            for _, _, role, content, timestamp, rl_used in rows
+        ]
 
-        logger.info(f"Returning session with {len(formatted_messages)} messages")
+        logger.debug("Returning session with %d messages", len(formatted_messages))
 
-        return jsonify({"session": session, "messages": formatted_messages}), 200
+        response_data = {"session": session, "messages": formatted_messages}
+        if limit is not None and len(rows) == limit:
+            response_data["next_after_id"] = rows[-1][0]
+
+        return ojsonify(response_data, 200)
 
     except Exception as e:
-        logger.error(f"Error retrieving session {session_id}: {e}")
-        return jsonify({"error": str(e)}), 500
+        logger.error("Error retrieving session %s: %s", session_id, e)
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route("/sessions/<session_id>", methods=["DELETE"])
 def delete_session(session_id):
     """Delete a chat session."""
     try:
-        logger.info(f"Received DELETE request to /sessions/{session_id} endpoint")
+        logger.info("Received DELETE request to /sessions/%s endpoint", session_id)
 
         success = feedback_db.delete_session(session_id)
 
         if success:
-            logger.info(f"Session {session_id} deleted successfully")
-            return jsonify({"status": "success", "message": "Session deleted"}), 200
+            logger.info("Session %s deleted successfully", session_id)
+            return ojsonify({"status": "success", "message": "Session deleted"}, 200)
         else:
-            return jsonify({"error": "Failed to delete session"}), 500
+            return ojsonify({"error": "Failed to delete session"}, 500)
 
     except Exception as e:
-        logger.error(f"Error deleting session {session_id}: {e}")
-        return jsonify({"error": str(e)}), 500
+        logger.error("Error deleting session %s: %s", session_id, e)
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint with system status"""
-    logger.info("Received GET request to /health endpoint")
-
-    logger.info("Health check - Database connected: True")
-
-    return jsonify(
+    return ojsonify(
         {
             "status": "healthy",
             "database_connected": True,
-        }
-    ), 200
+            "llm_cache": llm_cache.stats(),
+            "semantic_cache": semantic_cache.stats(),
+            "stock_cache": stock_fetcher.cache_stats(),
+        },
+        200,
+    )
 
 
 if __name__ == "__main__":
@@ -808,4 +1320,4 @@ if __name__ == "__main__":
     logger.info(f"Flask app running in {'DEBUG' if True else 'PRODUCTION'} mode")
     logger.info("=" * 80)
 
-    app.run(debug=True)
+    app.run(debug=True, threaded=True)
@@ -4,7 +4,7 @@ Supports: OpenAI, Azure OpenAI, Groq, Anthropic
 """
 
 import os
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Any
 from langchain_openai import ChatOpenAI, AzureChatOpenAI
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
@@ -154,23 +154,9 @@ class LLMService:
             if not prompt or not prompt.strip():
                 error_msg = "Prompt cannot be None or empty"
                 if self.logger:
-                    self.logger.error(f"LLMService.generate validation error: {error_msg}")
+                    self.logger.error("LLMService.generate validation error: %s", error_msg)
                 raise ValueError(error_msg)
 
-            if self.logger:
-                self.logger.info("=" * 50)
-                self.logger.info(f"LLMService.generate called - Provider: {self.provider}")
-                self.logger.info(f"Prompt length: {len(prompt)} chars")
-                self.logger.info(
-                    f"System prompt: {'present (' + str(len(system_prompt)) + ' chars)' if system_prompt else 'none'}"
-                )
-                self.logger.info(
-                    f"Temperature: {temperature if temperature is not None else self.temperature}"
-                )
-                self.logger.info(
-                    f"Max tokens: {max_tokens if max_tokens is not None else self.max_tokens}"
-                )
-
             messages = []
 
             if system_prompt:
@@ -178,21 +164,22 @@ class LLMService:
 
             messages.append(HumanMessage(content=prompt))
 
-            if self.logger:
-                self.logger.info(f"Total messages: {len(messages)}")
-
             # Create client with override parameters if provided
             if temperature is not None or max_tokens is not None:
-                if self.logger:
-                    self.logger.info("Using client with parameter overrides")
                 client = self._get_client_with_overrides(temperature, max_tokens)
             else:
-                if self.logger:
-                    self.logger.info("Using default client configuration")
                 client = self.client
 
             if self.logger:
-                self.logger.info("Invoking LLM API...")
+                self.logger.debug(
+                    "LLMService.generate - Provider: %s, Prompt: %d chars, System prompt: %d chars, "
+                    "Temperature: %s, Max tokens: %s",
+                    self.provider,
+                    len(prompt),
+                    len(system_prompt) if system_prompt else 0,
+                    temperature if temperature is not None else self.temperature,
+                    max_tokens if max_tokens is not None else self.max_tokens,
+                )
 
             response = client.invoke(messages)
 
@@ -203,25 +190,157 @@ class LLMService:
                 raise RuntimeError(error_msg)
 
             if self.logger:
-                self.logger.info(f"Response received - Length: {len(response.content)} chars")
-                self.logger.info("=" * 50)
+                self.logger.debug("Response received - Length: %d chars", len(response.content))
 
             return response.content
 
         except ValueError as ve:
             if self.logger:
-                self.logger.error(f"Validation error in LLMService.generate: {ve}")
+                self.logger.error("Validation error in LLMService.generate: %s", ve)
             raise
         except Exception as e:
             if self.logger:
-                self.logger.error("=" * 50)
-                self.logger.error(f"Critical error in LLMService.generate: {e}")
-                self.logger.error(f"Error type: {type(e).__name__}")
-                self.logger.error(f"Provider: {self.provider}")
-                self.logger.error(f"Model: {self.model_name}")
-                self.logger.error("=" * 50)
+                self.logger.error(
+                    "Error in LLMService.generate (%s, provider: %s, model: %s): %s",
+                    type(e).__name__,
+                    self.provider,
+                    self.model_name,
+                    e,
+                )
             raise
 
+    def generate_json(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate a structured response that conforms to a JSON schema
+
+        Uses the provider's structured output support (JSON schema or tool
+        calling) through LangChain, so the result is parsed by the provider
+        integration instead of being extracted from free text.
+
+        Args:
+            prompt: User prompt/message
+            schema: JSON schema with top-level "title" and "description"
+            system_prompt: Optional system message
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+
+        Returns:
+            Dictionary matching the schema
+
+        Raises:
+            ValueError: If prompt is None or empty
+            RuntimeError: If the LLM returns no structured output
+        """
+        if not prompt or not prompt.strip():
+            error_msg = "Prompt cannot be None or empty"
+            if self.logger:
+                self.logger.error("LLMService.generate_json validation error: %s", error_msg)
+            raise ValueError(error_msg)
+
+        messages = []
+
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+
+        messages.append(HumanMessage(content=prompt))
+
+        # Create client with override parameters if provided
+        if temperature is not None or max_tokens is not None:
+            client = self._get_client_with_overrides(temperature, max_tokens)
+        else:
+            client = self.client
+
+        if self.logger:
+            self.logger.debug(
+                "LLMService.generate_json - Provider: %s, Schema: %s",
+                self.provider,
+                schema.get("title", "unnamed"),
+            )
+
+        try:
+            result = client.with_structured_output(schema).invoke(messages)
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Error generating structured output (%s): %s", type(e).__name__, e)
+            raise
+
+        if not isinstance(result, dict):
+            error_msg = "LLM returned no structured output"
+            if self.logger:
+                self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        return result
+
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Generate a response incrementally using the configured LLM
+
+        Args:
+            prompt: User prompt/message
+            system_prompt: Optional system message
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+
+        Yields:
+            Text chunks as they are received from the provider
+
+        Raises:
+            ValueError: If prompt is None or empty
+        """
+        if not prompt or not prompt.strip():
+            error_msg = "Prompt cannot be None or empty"
+            if self.logger:
+                self.logger.error("LLMService.stream validation error: %s", error_msg)
+            raise ValueError(error_msg)
+
+        messages = []
+
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+
+        messages.append(HumanMessage(content=prompt))
+
+        # Create client with override parameters if provided
+        if temperature is not None or max_tokens is not None:
+            client = self._get_client_with_overrides(temperature, max_tokens)
+        else:
+            client = self.client
+
+        if self.logger:
+            self.logger.debug("LLMService.stream - Provider: %s", self.provider)
+
+        try:
+            for chunk in client.stream(messages):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Error streaming from LLM (%s): %s", type(e).__name__, e)
+            raise
+
+    def warm_up(self):
+        """
+        Send a one-token request through the default client
+
+        Opens the HTTP connection (DNS, TLS handshake) used by calls without
+        parameter overrides, so the first real request doesn't pay for it.
+        """
+        self.client.bind(max_tokens=1).invoke([HumanMessage(content="ping")])
+
     def generate_with_history(
         self,
         prompt: str,
@@ -266,18 +385,18 @@ class LLMService:
                 client = self.client
 
             if self.logger:
-                self.logger.info(f"Generating with history - Messages: {len(messages)}")
+                self.logger.debug("Generating with history - Messages: %d", len(messages))
 
             response = client.invoke(messages)
 
             if self.logger:
-                self.logger.info(f"Response generated - Length: {len(response.content)} chars")
+                self.logger.debug("Response generated - Length: %d chars", len(response.content))
 
             return response.content
 
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error generating with history: {e}")
+                self.logger.error("Error generating with history: %s", e)
             raise
 
     def _get_client_with_overrides(
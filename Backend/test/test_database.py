@@ -0,0 +1,204 @@
+"""
+Tests for FeedbackDatabase: connection pool concurrency, transactions,
+session/message cascade and the schema migration
+Run with: python -m pytest test/test_database.py
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+
+import pytest
+
+# Add Backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import FeedbackDatabase  # noqa: E402
+from utils.logger import CustomLogger  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "feedback.db")
+
+
+@pytest.fixture
+def db(db_path):
+    database = FeedbackDatabase(db_path, CustomLogger(), pool_size=4)
+    yield database
+    database.close()
+
+
+def test_concurrent_writes_and_reads(db):
+    """Writers share the single write connection while readers use the pool"""
+    db.create_session("s1", "Concurrency")
+    threads_count, per_thread = 16, 25
+    errors = []
+
+    def worker(worker_id):
+        try:
+            for i in range(per_thread):
+                message_id = db.save_message("s1", "user", f"{worker_id}-{i}")
+                assert message_id > 0
+                db.get_session_messages("s1", limit=10)
+                db.get_feedback_stats()
+        except Exception as e:  # checked in the main thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    messages = db.get_session_messages("s1")
+    assert len(messages) == threads_count * per_thread
+    assert len({message["content"] for message in messages}) == threads_count * per_thread
+    assert db._pool._reader_count <= 4
+
+
+def test_transaction_commits_nested_writes(db):
+    with db.transaction():
+        db.create_session("s1", "Committed")
+        db.save_message("s1", "user", "hello")
+        with db.transaction():
+            db.save_messages([("s1", "assistant", "hi", False)])
+            db.save_feedback("hello", "hi", 1, session_id="s1")
+
+    assert [m["content"] for m in db.get_session_messages("s1")] == ["hello", "hi"]
+    assert db.get_feedback_stats()["total_feedback"] == 1
+
+
+def test_transaction_rolls_back_on_exception(db):
+    db.create_session("s1", "Rollback")
+    db.save_message("s1", "user", "kept")
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.save_message("s1", "user", "discarded")
+            db.save_feedback("q", "a", 0)
+            raise RuntimeError("abort")
+
+    assert [m["content"] for m in db.get_session_messages("s1")] == ["kept"]
+    assert db.get_feedback_stats()["total_feedback"] == 0
+
+    # The write connection is usable again after the rollback
+    assert db.save_message("s1", "assistant", "after") > 0
+    assert len(db.get_session_messages("s1")) == 2
+
+
+def test_transaction_rolls_back_on_database_error(db):
+    """A failed write inside the block raises and undoes the earlier writes"""
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.transaction():
+            db.create_session("s1", "Partial")
+            # content is NOT NULL, so the second row fails inside SQLite
+            db.save_messages([("s1", "user", "q", False), ("s1", "assistant", None, False)])
+
+    assert db.get_session("s1") is None
+    assert db.get_session_messages("s1") == []
+
+    # Outside a transaction the write methods still report failure by return value
+    assert db.save_messages([("s1", "assistant", None, False)]) is False
+    assert db.create_session("s1", "Whole") is not None
+    assert db.create_session("s1", "Duplicate") is None
+
+
+def test_delete_session_cascades_to_messages(db, db_path):
+    db.create_session("s1", "Deleted")
+    db.create_session("s2", "Kept")
+    db.save_messages([
+        ("s1", "user", "a", False),
+        ("s1", "assistant", "b", True),
+        ("s2", "user", "c", False),
+    ])
+
+    assert db.delete_session("s1") is True
+
+    assert db.get_session("s1") is None
+    assert db.get_session_messages("s1") == []
+    assert [m["content"] for m in db.get_session_messages("s2")] == ["c"]
+    with closing(sqlite3.connect(db_path)) as conn:
+        orphans = conn.execute(
+            "SELECT COUNT(*) FROM chat_messages WHERE session_id = 's1'"
+        ).fetchone()[0]
+    assert orphans == 0
+
+
+def test_sessions_version_changes_on_reorder_within_a_second(db):
+    db.create_session("a", "A")
+    db.create_session("b", "B")
+    db.save_message("a", "user", "first")
+    version = db.get_sessions_version()
+
+    # Touching the older session in the same second reorders the list
+    db.save_message("b", "user", "second")
+    assert db.get_sessions_version() != version
+
+    version = db.get_sessions_version()
+    db.update_session_summary("b", "summary")
+    assert db.get_sessions_version() == version
+
+    db.delete_session("a")
+    assert db.get_sessions_version() != version
+
+
+def test_migrates_text_timestamps_to_epoch(db_path):
+    """A database created by the original schema is upgraded in place"""
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.executescript("""
+            CREATE TABLE feedback (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                rating INTEGER NOT NULL CHECK(rating IN (0, 1)),
+                session_id TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                metadata TEXT
+            );
+            CREATE TABLE chat_sessions (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE chat_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
+                content TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                rl_used INTEGER DEFAULT 0,
+                FOREIGN KEY (session_id) REFERENCES chat_sessions(id) ON DELETE CASCADE
+            );
+            INSERT INTO feedback (question, answer, rating, timestamp)
+            VALUES ('q', 'a', 1, '2024-01-02 03:04:05');
+            INSERT INTO chat_sessions (id, title) VALUES ('s1', 'Old');
+            INSERT INTO chat_messages (session_id, role, content, timestamp)
+            VALUES ('s1', 'user', 'hello', '2024-01-02 03:04:05');
+        """)
+
+    database = FeedbackDatabase(db_path, CustomLogger())
+    try:
+        assert database.get_session_messages("s1")[0]["timestamp"] == 1704164645
+        assert database.get_session("s1")["title"] == "Old"
+    finally:
+        database.close()
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        for table in ("feedback", "chat_messages"):
+            types = conn.execute(f"SELECT DISTINCT typeof(timestamp) FROM {table}").fetchall()
+            assert types == [("integer",)]
+        session_columns = {row[1] for row in conn.execute("PRAGMA table_info(chat_sessions)")}
+        assert "summary" in session_columns
+
+    # Opening an already migrated database again leaves the data unchanged
+    database = FeedbackDatabase(db_path, CustomLogger())
+    try:
+        assert database.get_session_messages("s1")[0]["timestamp"] == 1704164645
+    finally:
+        database.close()
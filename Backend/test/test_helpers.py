@@ -0,0 +1,63 @@
+"""
+Tests for the regex pre-screen that runs before LLM stock symbol extraction
+Run with: python -m pytest test/test_helpers.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add Backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.helpers import prescreen_stock_query  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "how is reliance doing",
+        "tell me about infosys",
+        "compare apple and microsoft",
+        "what about nvidia",
+        "how is adani ports",
+        "Analyze Tata Motors",
+        "should I buy hdfc bank",
+        "is state bank of india a good investment",
+        "what is the share price of wipro",
+        "market cap of tcs",
+        "$AAPL vs microsoft",
+    ],
+)
+def test_possible_stock_questions_reach_the_llm(question):
+    assert prescreen_stock_query(question) == (True, [])
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "What are bonds?",
+        "Explain mutual funds",
+        "what is inflation",
+        "how do i save for retirement",
+        "What is the difference between a fixed deposit and a mutual fund?",
+        "how much should I save in an emergency fund",
+        "is $ten a lot of money",
+    ],
+)
+def test_generic_questions_skip_symbol_extraction(question):
+    assert prescreen_stock_query(question) == (False, [])
+
+
+@pytest.mark.parametrize(
+    "question, symbols",
+    [
+        ("$AAPL price", ["AAPL"]),
+        ("what is the price of RELIANCE.NS", ["RELIANCE.NS"]),
+        ("compare $MSFT and $AAPL and $MSFT", ["MSFT", "AAPL"]),
+        ("tcs.bo share price", ["TCS.BO"]),
+    ],
+)
+def test_explicit_symbols_skip_the_llm(question, symbols):
+    assert prescreen_stock_query(question) == (True, symbols)
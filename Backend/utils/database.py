@@ -1,9 +1,323 @@
 import sqlite3
 import os
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import queue
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from .logger import CustomLogger
 
+# Connections return plain tuples; these name the columns when rows are
+# turned into dictionaries for callers. Feedback metadata can be large and is opt-in.
+_FEEDBACK_FIELDS = ("id", "question", "answer", "rating", "session_id", "timestamp")
+_FEEDBACK_FIELDS_WITH_METADATA = _FEEDBACK_FIELDS + ("metadata",)
+_SESSION_FIELDS = ("id", "title", "created_at", "updated_at")
+_MESSAGE_FIELDS = ("id", "session_id", "role", "content", "timestamp", "rl_used")
+
+# feedback and chat_messages store timestamps as integer Unix epoch seconds.
+# Inserts set them explicitly because tables created before schema version 1
+# still declare a text CURRENT_TIMESTAMP default.
+_SQL_EPOCH_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+_SCHEMA_VERSION = 1
+
+# Every query is built once here, so each call hands SQLite's statement cache
+# the exact same text and reuses the compiled statement. Values, including
+# limits and cursors, are always bound rather than formatted into the SQL.
+
+# Feedback
+
+_SQL_INSERT_FEEDBACK = f"""
+    INSERT INTO feedback (question, answer, rating, session_id, metadata, timestamp)
+    VALUES (?, ?, ?, ?, ?, {_SQL_EPOCH_NOW})
+"""
+
+# Single-row inserts get the new id back from the INSERT itself (executemany
+# cannot return rows, so batch paths use the plain statements)
+_SQL_INSERT_FEEDBACK_RETURNING_ID = _SQL_INSERT_FEEDBACK + "RETURNING id"
+
+# LIMIT -1 means no limit
+_SQL_SELECT_FEEDBACK = f"""
+    SELECT {", ".join(_FEEDBACK_FIELDS)}
+    FROM feedback
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_SELECT_FEEDBACK_WITH_METADATA = f"""
+    SELECT {", ".join(_FEEDBACK_FIELDS_WITH_METADATA)}
+    FROM feedback
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_SELECT_RECENT_FEEDBACK = f"""
+    SELECT {", ".join(_FEEDBACK_FIELDS)}
+    FROM feedback
+    WHERE timestamp >= ?
+    ORDER BY timestamp DESC
+"""
+
+_SQL_SELECT_RECENT_FEEDBACK_WITH_METADATA = f"""
+    SELECT {", ".join(_FEEDBACK_FIELDS_WITH_METADATA)}
+    FROM feedback
+    WHERE timestamp >= ?
+    ORDER BY timestamp DESC
+"""
+
+# SQLite assembles the training text, so each row arrives ready to use
+_SQL_SELECT_TRAINING_SAMPLES = """
+    SELECT 'Q: ' || question || char(10) || 'A: ' || answer, rating
+    FROM feedback
+    ORDER BY timestamp ASC
+"""
+
+_SQL_SELECT_FEEDBACK_RATINGS = """
+    SELECT rating, timestamp
+    FROM feedback
+    ORDER BY timestamp ASC
+"""
+
+# Total, rating distribution and recent count in one pass
+_SQL_SELECT_FEEDBACK_STATS = """
+    SELECT COUNT(*),
+           COALESCE(SUM(rating = 1), 0),
+           COALESCE(SUM(rating = 0), 0),
+           COALESCE(SUM(timestamp >= ?), 0)
+    FROM feedback
+"""
+
+_SQL_DELETE_FEEDBACK_BEFORE = """
+    DELETE FROM feedback
+    WHERE timestamp < ?
+"""
+
+# Sessions
+
+_SQL_INSERT_SESSION = """
+    INSERT INTO chat_sessions (id, title)
+    VALUES (?, ?)
+    RETURNING id, title, created_at, updated_at
+"""
+
+_SQL_UPDATE_SESSION_TITLE = """
+    UPDATE chat_sessions
+    SET title = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_TOUCH_SESSION = """
+    UPDATE chat_sessions
+    SET updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_SESSION_SUMMARY = """
+    UPDATE chat_sessions
+    SET summary = ?
+    WHERE id = ?
+"""
+
+_SQL_SELECT_SESSION_SUMMARY = """
+    SELECT summary
+    FROM chat_sessions
+    WHERE id = ?
+"""
+
+_SQL_SELECT_SESSIONS_VERSION = "SELECT version FROM sessions_version"
+
+_SQL_SELECT_SESSION = """
+    SELECT id, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE id = ?
+"""
+
+# Session list pages, newest first; LIMIT -1 means no limit
+_SQL_SELECT_SESSIONS = """
+    SELECT id, title, created_at, updated_at
+    FROM chat_sessions
+    ORDER BY updated_at DESC, id DESC
+    LIMIT ?
+"""
+
+_SQL_SELECT_SESSIONS_BEFORE = """
+    SELECT id, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE updated_at < ?
+    ORDER BY updated_at DESC, id DESC
+    LIMIT ?
+"""
+
+_SQL_SELECT_SESSIONS_BEFORE_ID = """
+    SELECT id, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE (updated_at, id) < (?, ?)
+    ORDER BY updated_at DESC, id DESC
+    LIMIT ?
+"""
+
+# Messages are removed by ON DELETE CASCADE (foreign_keys is on for every connection)
+_SQL_DELETE_SESSION = "DELETE FROM chat_sessions WHERE id = ?"
+
+_SQL_COUNT_SESSIONS = "SELECT COUNT(*) FROM chat_sessions"
+
+# Messages
+
+_SQL_INSERT_MESSAGE = f"""
+    INSERT INTO chat_messages (session_id, role, content, rl_used, timestamp)
+    VALUES (?, ?, ?, ?, {_SQL_EPOCH_NOW})
+"""
+
+_SQL_INSERT_MESSAGE_RETURNING_ID = _SQL_INSERT_MESSAGE + "RETURNING id"
+
+# Keyset page of a session's messages; ids increase with insertion order
+_SQL_SELECT_SESSION_MESSAGES = """
+    SELECT id, session_id, role, content, timestamp, rl_used
+    FROM chat_messages
+    WHERE session_id = ? AND id > ?
+    ORDER BY id ASC
+    LIMIT ?
+"""
+
+_SQL_SELECT_SESSION_MESSAGE_CONTENTS = """
+    SELECT role, content
+    FROM chat_messages
+    WHERE session_id = ?
+    ORDER BY id ASC
+"""
+
+_SQL_COUNT_MESSAGES = "SELECT COUNT(*) FROM chat_messages"
+
+
+def _epoch_cutoff(days: float) -> int:
+    """
+    Unix epoch seconds `days` ago.
+
+    Binding a precomputed cutoff lets timestamp filters use the index as a
+    plain integer range instead of evaluating date functions in the query.
+    """
+    return int(time.time() - days * 86400)
+
+
+class SQLiteConnectionPool:
+    """
+    Keeps SQLite connections open across calls so each request reuses a warm
+    page cache instead of reconnecting. SQLite allows one writer at a time, so
+    there is a single write connection guarded by a lock; with WAL, readers use
+    their own connections concurrently.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], max_readers: int = 8):
+        """
+        Args:
+            connect: Factory creating a configured connection usable from any thread
+            max_readers: Maximum number of read connections
+        """
+        self._connect = connect
+        self._max_readers = max_readers
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            if self._reader_count < self._max_readers:
+                self._reader_count += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._reader_lock:
+                    self._reader_count -= 1
+                raise
+        return self._readers.get()
+
+    @contextmanager
+    def acquire(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection for the duration of the with block.
+
+        Args:
+            write: Use the write connection (held exclusively until the block exits)
+
+        A write block commits when it exits normally, like "with conn:". Any
+        transaction left open otherwise, e.g. after an exception, is rolled back
+        before the connection is reused. Write acquisitions made inside
+        transaction() reuse the caller's connection and leave the commit to it.
+        """
+        if write and self.in_transaction():
+            yield self._writer
+        elif write:
+            with self._write_lock:
+                if self._writer is None:
+                    self._writer = self._connect()
+                conn = self._writer
+                try:
+                    yield conn
+                    if conn.in_transaction:
+                        conn.commit()
+                finally:
+                    if conn.in_transaction:
+                        conn.rollback()
+        else:
+            conn = self._get_reader()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._readers.put(conn)
+
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside a transaction() block."""
+        return getattr(self._local, "in_transaction", False)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the write connection and commit once when the block exits.
+
+        Writes made inside the block share that single commit; an exception
+        rolls back everything written in the block.
+        """
+        if self.in_transaction():
+            # Nested blocks join the outer transaction
+            yield self._writer
+            return
+
+        with self.acquire(write=True) as conn:
+            self._local.in_transaction = True
+            try:
+                yield conn
+            finally:
+                self._local.in_transaction = False
+
+    def close(self):
+        """Close all idle connections."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._reader_lock:
+                self._reader_count -= 1
+
 
 class FeedbackDatabase:
     """
@@ -12,76 +326,179 @@ class FeedbackDatabase:
     Also manages chat sessions and conversation history.
     """
 
-    def __init__(self, db_path: str, logger: CustomLogger):
+    def __init__(
+        self,
+        db_path: str,
+        logger: CustomLogger,
+        pool_size: int = 8,
+        optimize_every_writes: int = 1000,
+    ):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            logger: Application logger
+            pool_size: Maximum number of pooled read connections
+            optimize_every_writes: Run PRAGMA optimize after this many inserted
+                rows (0 disables the periodic run)
+        """
         self.db_path = db_path
         self.logger = logger
+        self._optimize_every_writes = optimize_every_writes
+        self._writes_since_optimize = 0
+        self._write_count_lock = threading.Lock()
         self._initialize_database()
+        self._pool = SQLiteConnectionPool(self._get_connection, max_readers=pool_size)
 
     def _initialize_database(self):
         """Create database and tables if they don't exist"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Create feedback table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS feedback (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    question TEXT NOT NULL,
-                    answer TEXT NOT NULL,
-                    rating INTEGER NOT NULL CHECK(rating IN (0, 1)),
-                    session_id TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT
-                )
-            """)
-
-            # Create chat_sessions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS chat_sessions (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            # The connection commits when the block succeeds and is always closed
+            with closing(self._get_connection()) as conn, conn:
+                cursor = conn.cursor()
+
+                # WAL lets readers run alongside a writer and needs fewer fsyncs per
+                # commit; the mode is persistent, so setting it once here is enough.
+                # Per-connection settings are applied in _get_connection.
+                cursor.execute("PRAGMA journal_mode=WAL")
+
+                # Create feedback table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS feedback (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        question TEXT NOT NULL,
+                        answer TEXT NOT NULL,
+                        rating INTEGER NOT NULL CHECK(rating IN (0, 1)),
+                        session_id TEXT,
+                        timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                        metadata TEXT
+                    )
+                """)
+
+                # Create chat_sessions table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS chat_sessions (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        summary TEXT
+                    )
+                """)
+
+                # Add summary column to databases created before it existed
+                cursor.execute("PRAGMA table_info(chat_sessions)")
+                session_columns = {row[1] for row in cursor.fetchall()}  # (cid, name, ...)
+                if "summary" not in session_columns:
+                    cursor.execute("ALTER TABLE chat_sessions ADD COLUMN summary TEXT")
+                    self.logger.info("Added summary column to chat_sessions")
+
+                # Create chat_messages table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS chat_messages (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        session_id TEXT NOT NULL,
+                        role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
+                        content TEXT NOT NULL,
+                        timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                        rl_used INTEGER DEFAULT 0,
+                        FOREIGN KEY (session_id) REFERENCES chat_sessions(id) ON DELETE CASCADE
+                    )
+                """)
+
+                # Schema version 1: convert text timestamps from older databases
+                # to epoch seconds
+                cursor.execute("PRAGMA user_version")
+                schema_version = cursor.fetchone()[0]
+                if schema_version < 1:
+                    converted = 0
+                    for table in ("feedback", "chat_messages"):
+                        cursor.execute(f"""
+                            UPDATE {table}
+                            SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER)
+                            WHERE typeof(timestamp) = 'text'
+                        """)
+                        converted += cursor.rowcount
+                    if converted:
+                        self.logger.info(f"Converted {converted} timestamps to epoch seconds")
+                if schema_version < _SCHEMA_VERSION:
+                    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+                # Indexes added after release; the planner needs fresh statistics
+                # the first time they appear
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN (?, ?)",
+                    ("idx_feedback_train_cover", "idx_messages_session_id_cover"),
                 )
-            """)
-
-            # Create chat_messages table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS chat_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
-                    content TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    rl_used INTEGER DEFAULT 0,
-                    FOREIGN KEY (session_id) REFERENCES chat_sessions(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Create indexes for faster queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp 
-                ON feedback(timestamp DESC)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rating 
-                ON feedback(rating)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_session_updated 
-                ON chat_sessions(updated_at DESC)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_session 
-                ON chat_messages(session_id, timestamp)
-            """)
-
-            conn.commit()
-            conn.close()
+                needs_analyze = cursor.fetchone()[0] < 2
+
+                # Create indexes for faster queries
+                # Covering index: training reads are an index-only scan in timestamp
+                # order, and timestamp range filters use its prefix
+                cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_feedback_train_cover
+                    ON feedback(timestamp, question, answer, rating)
+                """)
+
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_rating 
+                    ON feedback(rating)
+                """)
+
+                # (updated_at, id) matches the session list order and its page cursor
+                cursor.execute("DROP INDEX IF EXISTS idx_session_updated")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_session_updated_id
+                    ON chat_sessions(updated_at DESC, id DESC)
+                """)
+
+                # Covering index in (session_id, id) order: a page of messages is a
+                # seek to the cursor followed by an index-only scan
+                cursor.execute("DROP INDEX IF EXISTS idx_messages_session")
+                cursor.execute("DROP INDEX IF EXISTS idx_messages_session_cover")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_messages_session_id_cover
+                    ON chat_messages(session_id, id, role, content, timestamp, rl_used)
+                """)
+
+                # Bump the session's updated_at whenever a message is added, in the
+                # same statement instead of a separate UPDATE
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_touch_session
+                    AFTER INSERT ON chat_messages
+                    BEGIN
+                        UPDATE chat_sessions
+                        SET updated_at = CURRENT_TIMESTAMP
+                        WHERE id = NEW.session_id;
+                    END
+                """)
+
+                # Change counter for the session list, bumped by triggers on every
+                # insert, delete and reordering update so HTTP caching doesn't depend
+                # on updated_at's one-second resolution
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sessions_version (
+                        id INTEGER PRIMARY KEY CHECK(id = 0),
+                        version INTEGER NOT NULL
+                    )
+                """)
+                cursor.execute("INSERT OR IGNORE INTO sessions_version (id, version) VALUES (0, 0)")
+                for event in ("INSERT", "DELETE", "UPDATE OF title, updated_at"):
+                    trigger_name = "trg_sessions_version_" + event.split()[0].lower()
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {trigger_name}
+                        AFTER {event} ON chat_sessions
+                        BEGIN
+                            UPDATE sessions_version SET version = version + 1;
+                        END
+                    """)
+
+                if needs_analyze:
+                    cursor.execute("ANALYZE")
+
+                # Refresh planner statistics for tables that changed noticeably
+                # since the last run (bounded by analysis_limit)
+                cursor.execute("PRAGMA optimize")
 
             self.logger.info(f"Database initialized successfully at {self.db_path}")
 
@@ -90,15 +507,83 @@ class FeedbackDatabase:
             raise
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection"""
+        """Open a new configured database connection (pooled connections use this)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+            # Pooled connections live for the whole process, so keep enough
+            # compiled statements around for every query this class issues
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            # Safe with WAL: only sync at checkpoints instead of every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Wait for a concurrent writer instead of failing with "database is locked"
+            conn.execute("PRAGMA busy_timeout=5000")
+            # Enforce the ON DELETE CASCADE declared on chat_messages
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+            conn.execute("PRAGMA mmap_size=268435456")  # Memory-map up to 256 MB
+            # Let ANALYZE (run by PRAGMA optimize) sample indexes instead of scanning them
+            conn.execute("PRAGMA analysis_limit=400")
             return conn
         except sqlite3.Error as e:
             self.logger.error(f"Error connecting to database: {e}")
             raise
 
+    def optimize(self):
+        """Let SQLite refresh query planner statistics (run periodically or on shutdown)."""
+        try:
+            with self._pool.acquire(write=True) as conn:
+                conn.execute("PRAGMA optimize")
+            self.logger.info("Database optimized")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error optimizing database: {e}")
+
+    def _record_writes(self, count: int):
+        """Count inserted rows and run PRAGMA optimize every optimize_every_writes rows."""
+        if not self._optimize_every_writes:
+            return
+
+        with self._write_count_lock:
+            self._writes_since_optimize += count
+            if self._writes_since_optimize < self._optimize_every_writes:
+                return
+            self._writes_since_optimize = 0
+
+        self.optimize()
+
+    def close(self):
+        """Optimize the database and close pooled connections (call on shutdown)."""
+        self.optimize()
+        self._pool.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into one transaction with a single commit.
+
+        Example:
+            with feedback_db.transaction():
+                feedback_db.save_message(session_id, "user", question)
+                feedback_db.save_message(session_id, "assistant", answer)
+
+        The write connection is held by the calling thread until the block exits,
+        and an exception raised inside it rolls back all of its writes. Database
+        errors in the write methods are re-raised inside the block instead of being
+        reported through their return value, so a failed write rolls back the rest.
+        """
+        with self._pool.transaction():
+            yield
+
+    def warm_up(self):
+        """Read the session tables once so the first request doesn't hit a cold page cache."""
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SQL_COUNT_SESSIONS)
+                cursor.execute(_SQL_COUNT_MESSAGES)
+            self.logger.info("Database warm-up complete")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error warming up database: {e}")
+
     def save_feedback(
         self,
         question: str,
@@ -124,52 +609,81 @@ class FeedbackDatabase:
             raise ValueError("Rating must be 0 (negative) or 1 (positive)")
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                INSERT INTO feedback (question, answer, rating, session_id, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (question, answer, rating, session_id, metadata),
-            )
+                cursor.execute(
+                    _SQL_INSERT_FEEDBACK_RETURNING_ID,
+                    (question, answer, rating, session_id, metadata),
+                )
 
-            feedback_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+                feedback_id = cursor.fetchone()[0]
 
-            self.logger.info(f"Saved feedback (ID: {feedback_id}, Rating: {rating})")
+            self.logger.debug("Saved feedback (ID: %s, Rating: %s)", feedback_id, rating)
+            self._record_writes(1)
             return feedback_id
 
         except sqlite3.Error as e:
             self.logger.error(f"Error saving feedback: {e}")
             raise
 
-    def get_all_feedback(self, limit: Optional[int] = None) -> List[Dict]:
+    def save_feedback_batch(
+        self, rows: List[Tuple[str, str, int, Optional[str], Optional[str]]]
+    ) -> int:
+        """
+        Save several feedback records in a single transaction.
+
+        Args:
+            rows: List of (question, answer, rating, session_id, metadata) tuples
+
+        Returns:
+            Number of records inserted
+        """
+        for row in rows:
+            if row[2] not in (0, 1):
+                raise ValueError("Rating must be 0 (negative) or 1 (positive)")
+
+        try:
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany(_SQL_INSERT_FEEDBACK, rows)
+
+            self.logger.debug("Saved %d feedback records", len(rows))
+            self._record_writes(len(rows))
+            return len(rows)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error saving feedback batch: {e}")
+            raise
+
+    def get_all_feedback(
+        self, limit: Optional[int] = None, include_metadata: bool = False
+    ) -> List[Dict]:
         """
         Retrieve all feedback records.
 
         Args:
             limit: Optional limit on number of records
+            include_metadata: Also return the metadata column
 
         Returns:
             List of feedback dictionaries
         """
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        if include_metadata:
+            fields, query = _FEEDBACK_FIELDS_WITH_METADATA, _SQL_SELECT_FEEDBACK_WITH_METADATA
+        else:
+            fields, query = _FEEDBACK_FIELDS, _SQL_SELECT_FEEDBACK
 
-            query = "SELECT * FROM feedback ORDER BY timestamp DESC"
-            if limit:
-                query += f" LIMIT {limit}"
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            conn.close()
+                cursor.execute(query, (int(limit) if limit else -1,))
+                rows = cursor.fetchall()
 
-            feedback_list = [dict(row) for row in rows]
-            self.logger.info(f"Retrieved {len(feedback_list)} feedback records")
+            feedback_list = [dict(zip(fields, row)) for row in rows]
+            self.logger.debug("Retrieved %d feedback records", len(feedback_list))
 
             return feedback_list
 
@@ -177,76 +691,92 @@ class FeedbackDatabase:
             self.logger.error(f"Error retrieving feedback: {e}")
             return []
 
-    def get_feedback_for_training(self, min_samples: int = 0) -> Tuple[List[str], List[int]]:
+    def iter_feedback_for_training(self, batch_size: int = 1000) -> Iterator[Tuple[str, int]]:
         """
-        Get feedback data formatted for model training.
+        Stream feedback formatted for model training, oldest first.
+
+        Rows are fetched batch_size at a time, so memory stays flat however
+        much feedback is stored. A read connection is held until the
+        generator is exhausted or closed.
 
         Args:
-            min_samples: Minimum number of samples required
+            batch_size: Number of rows fetched from SQLite per round trip
 
-        Returns:
-            Tuple of (texts, labels) where texts are "Q: {q}\\nA: {a}" format
+        Yields:
+            (text, label) pairs where text is "Q: {q}\nA: {a}"
+
+        Raises:
+            sqlite3.Error: If the query fails
         """
-        try:
-            conn = self._get_connection()
+        with self._pool.acquire(write=False) as conn:
             cursor = conn.cursor()
+            cursor.arraysize = batch_size
 
-            cursor.execute("""
-                SELECT question, answer, rating 
-                FROM feedback 
-                ORDER BY timestamp ASC
-            """)
-
-            rows = cursor.fetchall()
-            conn.close()
+            cursor.execute(_SQL_SELECT_TRAINING_SAMPLES)
 
-            if len(rows) < min_samples:
-                self.logger.warning(f"Insufficient feedback samples: {len(rows)} < {min_samples}")
-                return [], []
+            while rows := cursor.fetchmany():
+                yield from rows
 
-            texts = [f"Q: {row['question']}\nA: {row['answer']}" for row in rows]
-            labels = [row["rating"] for row in rows]
+    def get_feedback_for_training(self, min_samples: int = 0) -> Tuple[List[str], List[int]]:
+        """
+        Get feedback data formatted for model training.
 
-            self.logger.info(
-                f"Retrieved {len(texts)} samples for training "
-                f"(Positive: {sum(labels)}, Negative: {len(labels) - sum(labels)})"
-            )
+        Use iter_feedback_for_training() to consume the samples lazily instead.
 
-            return texts, labels
+        Args:
+            min_samples: Minimum number of samples required
 
+        Returns:
+            Tuple of (texts, labels) where texts are "Q: {q}\nA: {a}" format
+        """
+        texts, labels = [], []
+        try:
+            for text, label in self.iter_feedback_for_training():
+                texts.append(text)
+                labels.append(label)
         except sqlite3.Error as e:
             self.logger.error(f"Error getting training data: {e}")
             return [], []
 
-    def get_recent_feedback(self, days: int = 7) -> List[Dict]:
+        if len(texts) < min_samples:
+            self.logger.warning(f"Insufficient feedback samples: {len(texts)} < {min_samples}")
+            return [], []
+
+        self.logger.info(
+            f"Retrieved {len(texts)} samples for training "
+            f"(Positive: {sum(labels)}, Negative: {len(labels) - sum(labels)})"
+        )
+
+        return texts, labels
+
+    def get_recent_feedback(self, days: int = 7, include_metadata: bool = False) -> List[Dict]:
         """
         Get feedback from the last N days.
 
         Args:
             days: Number of days to look back
+            include_metadata: Also return the metadata column
 
         Returns:
             List of feedback dictionaries
         """
+        if include_metadata:
+            fields = _FEEDBACK_FIELDS_WITH_METADATA
+            query = _SQL_SELECT_RECENT_FEEDBACK_WITH_METADATA
+        else:
+            fields, query = _FEEDBACK_FIELDS, _SQL_SELECT_RECENT_FEEDBACK
+
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                SELECT * FROM feedback 
-                WHERE timestamp >= datetime('now', '-' || ? || ' days')
-                ORDER BY timestamp DESC
-            """,
-                (days,),
-            )
+                cursor.execute(query, (_epoch_cutoff(days),))
 
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
 
-            feedback_list = [dict(row) for row in rows]
-            self.logger.info(
-                f"Retrieved {len(feedback_list)} feedback records from last {days} days"
+            feedback_list = [dict(zip(fields, row)) for row in rows]
+            self.logger.debug(
+                "Retrieved %d feedback records from last %s days", len(feedback_list), days
             )
 
             return feedback_list
@@ -255,47 +785,50 @@ class FeedbackDatabase:
             self.logger.error(f"Error retrieving recent feedback: {e}")
             return []
 
-    def get_feedback_stats(self) -> Dict:
+    def get_feedback_ratings(self) -> List[Tuple[int, int]]:
         """
-        Get statistics about stored feedback.
+        Get only the rating and timestamp of every feedback record, oldest first.
 
         Returns:
-            Dictionary with feedback statistics
+            List of (rating, epoch seconds) tuples
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
 
-            # Total count
-            cursor.execute("SELECT COUNT(*) as total FROM feedback")
-            total = cursor.fetchone()["total"]
+                cursor.execute(_SQL_SELECT_FEEDBACK_RATINGS)
 
-            # Rating distribution
-            cursor.execute("""
-                SELECT rating, COUNT(*) as count 
-                FROM feedback 
-                GROUP BY rating
-            """)
-            rating_dist = {row["rating"]: row["count"] for row in cursor.fetchall()}
+                rows = cursor.fetchall()
 
-            # Recent feedback (last 24 hours)
-            cursor.execute("""
-                SELECT COUNT(*) as recent 
-                FROM feedback 
-                WHERE timestamp >= datetime('now', '-1 day')
-            """)
-            recent_24h = cursor.fetchone()["recent"]
+            return [(row[0], row[1]) for row in rows]
 
-            conn.close()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error retrieving feedback ratings: {e}")
+            return []
+
+    def get_feedback_stats(self) -> Dict:
+        """
+        Get statistics about stored feedback.
+
+        Returns:
+            Dictionary with feedback statistics
+        """
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+
+                # Counts anything newer than 24 hours as recent
+                cursor.execute(_SQL_SELECT_FEEDBACK_STATS, (_epoch_cutoff(1),))
+                row = cursor.fetchone()
 
             stats = {
-                "total_feedback": total,
-                "positive_count": rating_dist.get(1, 0),
-                "negative_count": rating_dist.get(0, 0),
-                "recent_24h": recent_24h,
+                "total_feedback": row[0],
+                "positive_count": row[1],
+                "negative_count": row[2],
+                "recent_24h": row[3],
             }
 
-            self.logger.info(f"Feedback stats: {stats}")
+            self.logger.debug("Feedback stats: %s", stats)
             return stats
 
         except sqlite3.Error as e:
@@ -318,31 +851,25 @@ class FeedbackDatabase:
             Number of records deleted
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                DELETE FROM feedback 
-                WHERE timestamp < datetime('now', '-' || ? || ' days')
-            """,
-                (days,),
-            )
+                cursor.execute(_SQL_DELETE_FEEDBACK_BEFORE, (_epoch_cutoff(days),))
 
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
+                deleted_count = cursor.rowcount
 
             self.logger.info(f"Deleted {deleted_count} feedback records older than {days} days")
             return deleted_count
 
         except sqlite3.Error as e:
             self.logger.error(f"Error clearing old feedback: {e}")
+            if self._pool.in_transaction():
+                raise
             return 0
 
     # Chat Session Management Methods
 
-    def create_session(self, session_id: str, title: str) -> bool:
+    def create_session(self, session_id: str, title: str) -> Optional[Dict]:
         """
         Create a new chat session.
 
@@ -351,32 +878,30 @@ class FeedbackDatabase:
             title: Session title (max 50 chars recommended)
 
         Returns:
-            True if successful, False otherwise
+            The created session dictionary if successful, None otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                INSERT INTO chat_sessions (id, title)
-                VALUES (?, ?)
-            """,
-                (session_id, title[:50]),
-            )  # Truncate to 50 chars
+                # Truncate to 50 chars
+                cursor.execute(_SQL_INSERT_SESSION, (session_id, title[:50]))
 
-            conn.commit()
-            conn.close()
+                session = dict(zip(_SESSION_FIELDS, cursor.fetchone()))
 
-            self.logger.info(f"Created session: {session_id} - '{title}'")
-            return True
+            self.logger.debug("Created session: %s - '%s'", session_id, title)
+            return session
 
         except sqlite3.IntegrityError:
             self.logger.warning(f"Session {session_id} already exists")
-            return False
+            if self._pool.in_transaction():
+                raise
+            return None
         except sqlite3.Error as e:
             self.logger.error(f"Error creating session: {e}")
-            return False
+            if self._pool.in_transaction():
+                raise
+            return None
 
     def update_session_title(self, session_id: str, title: str) -> bool:
         """
@@ -390,73 +915,134 @@ class FeedbackDatabase:
             True if successful, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                UPDATE chat_sessions 
-                SET title = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """,
-                (title[:50], session_id),
-            )
-
-            conn.commit()
-            conn.close()
+                cursor.execute(_SQL_UPDATE_SESSION_TITLE, (title[:50], session_id))
 
-            self.logger.info(f"Updated session {session_id} title to '{title}'")
+            self.logger.debug("Updated session %s title to '%s'", session_id, title)
             return True
 
         except sqlite3.Error as e:
             self.logger.error(f"Error updating session title: {e}")
+            if self._pool.in_transaction():
+                raise
             return False
 
     def update_session_timestamp(self, session_id: str) -> bool:
         """Update session's updated_at timestamp."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                UPDATE chat_sessions 
-                SET updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """,
-                (session_id,),
-            )
-
-            conn.commit()
-            conn.close()
+                cursor.execute(_SQL_TOUCH_SESSION, (session_id,))
             return True
 
         except sqlite3.Error as e:
             self.logger.error(f"Error updating session timestamp: {e}")
+            if self._pool.in_transaction():
+                raise
+            return False
+
+    def update_session_summary(self, session_id: str, summary: str) -> bool:
+        """
+        Store the summarized conversation history for a session.
+
+        Args:
+            session_id: Session identifier
+            summary: Summarized conversation history
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(_SQL_UPDATE_SESSION_SUMMARY, (summary, session_id))
+            return True
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error updating session summary: {e}")
+            if self._pool.in_transaction():
+                raise
             return False
 
-    def get_all_sessions(self) -> List[Dict]:
+    def get_session_summary(self, session_id: str) -> Optional[str]:
+        """Get the stored conversation summary for a session, if any."""
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(_SQL_SELECT_SESSION_SUMMARY, (session_id,))
+
+                row = cursor.fetchone()
+
+            return row[0] if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error retrieving session summary: {e}")
+            return None
+
+    def get_sessions_version(self) -> Optional[int]:
         """
-        Get all chat sessions ordered by most recent.
+        Get a cheap fingerprint of the session list, used for HTTP caching.
+
+        Returns:
+            Counter that changes whenever a session is created, renamed, touched or
+            deleted (None if it can't be read)
+        """
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(_SQL_SELECT_SESSIONS_VERSION)
+
+                row = cursor.fetchone()
+
+            return row[0] if row else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error retrieving sessions version: {e}")
+            return None
+
+    def get_all_sessions(
+        self,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
+        before_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Get chat sessions ordered by most recent.
+
+        Args:
+            limit: Maximum number of sessions to return (all if None)
+            before: Only return sessions updated before this updated_at value
+            before_id: Tie-breaker for before; sessions with updated_at equal to
+                before and an id lower than this are also returned
 
         Returns:
             List of session dictionaries
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+
+                limit_param = limit if limit is not None else -1
 
-            cursor.execute("""
-                SELECT id, title, created_at, updated_at
-                FROM chat_sessions
-                ORDER BY updated_at DESC
-            """)
+                if before is None:
+                    cursor.execute(_SQL_SELECT_SESSIONS, (limit_param,))
+                elif before_id is None:
+                    cursor.execute(_SQL_SELECT_SESSIONS_BEFORE, (before, limit_param))
+                else:
+                    cursor.execute(
+                        _SQL_SELECT_SESSIONS_BEFORE_ID, (before, before_id, limit_param)
+                    )
 
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
 
-            sessions = [dict(row) for row in rows]
-            self.logger.info(f"Retrieved {len(sessions)} sessions")
+            sessions = [dict(zip(_SESSION_FIELDS, row)) for row in rows]
+            self.logger.debug("Retrieved %d sessions", len(sessions))
 
             return sessions
 
@@ -467,22 +1053,14 @@ class FeedbackDatabase:
     def get_session(self, session_id: str) -> Optional[Dict]:
         """Get a single session by ID."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                SELECT id, title, created_at, updated_at
-                FROM chat_sessions
-                WHERE id = ?
-            """,
-                (session_id,),
-            )
+                cursor.execute(_SQL_SELECT_SESSION, (session_id,))
 
-            row = cursor.fetchone()
-            conn.close()
+                row = cursor.fetchone()
 
-            return dict(row) if row else None
+            return dict(zip(_SESSION_FIELDS, row)) if row else None
 
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving session: {e}")
@@ -491,22 +1069,18 @@ class FeedbackDatabase:
     def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its messages."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Delete messages first (foreign key constraint)
-            cursor.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
-            # Delete session
-            cursor.execute("DELETE FROM chat_sessions WHERE id = ?", (session_id,))
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            conn.commit()
-            conn.close()
+                cursor.execute(_SQL_DELETE_SESSION, (session_id,))
 
             self.logger.info(f"Deleted session: {session_id}")
             return True
 
         except sqlite3.Error as e:
             self.logger.error(f"Error deleting session: {e}")
+            if self._pool.in_transaction():
+                raise
             return False
 
     def save_message(self, session_id: str, role: str, content: str, rl_used: bool = False) -> int:
@@ -526,63 +1100,138 @@ class FeedbackDatabase:
             raise ValueError("Role must be 'user' or 'assistant'")
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                INSERT INTO chat_messages (session_id, role, content, rl_used)
-                VALUES (?, ?, ?, ?)
-            """,
-                (session_id, role, content, 1 if rl_used else 0),
-            )
-
-            message_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+                cursor.execute(
+                    _SQL_INSERT_MESSAGE_RETURNING_ID,
+                    (session_id, role, content, 1 if rl_used else 0),
+                )
 
-            # Update session timestamp
-            self.update_session_timestamp(session_id)
+                message_id = cursor.fetchone()[0]
 
-            self.logger.info(f"Saved {role} message to session {session_id}")
+            self.logger.debug("Saved %s message to session %s", role, session_id)
+            self._record_writes(1)
             return message_id
 
         except sqlite3.Error as e:
             self.logger.error(f"Error saving message: {e}")
+            if self._pool.in_transaction():
+                raise
             return -1
 
-    def get_session_messages(self, session_id: str) -> List[Dict]:
+    def save_messages(self, messages: List[Tuple[str, str, str, bool]]) -> bool:
         """
-        Get all messages for a session.
+        Save several chat messages in a single transaction.
+
+        Args:
+            messages: List of (session_id, role, content, rl_used) tuples
+
+        Returns:
+            True if all messages were saved, False otherwise
+        """
+        for _, role, _, _ in messages:
+            if role not in ("user", "assistant"):
+                raise ValueError("Role must be 'user' or 'assistant'")
+
+        try:
+            with self._pool.acquire(write=True) as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany(
+                    _SQL_INSERT_MESSAGE,
+                    [
+                        (session_id, role, content, 1 if rl_used else 0)
+                        for session_id, role, content, rl_used in messages
+                    ],
+                )
+
+            self.logger.debug("Saved %d messages", len(messages))
+            self._record_writes(len(messages))
+            return True
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error saving messages: {e}")
+            if self._pool.in_transaction():
+                raise
+            return False
+
+    def get_session_message_rows(
+        self, session_id: str, after_id: int = 0, limit: Optional[int] = None
+    ) -> List[Tuple]:
+        """
+        Get messages for a session as raw rows, in the order they were sent.
+
+        Rows are tuples in _MESSAGE_FIELDS order: (id, session_id, role, content,
+        timestamp, rl_used). Callers that serialize them directly avoid building
+        an intermediate dictionary per message.
 
         Args:
             session_id: Session identifier
+            after_id: Only return messages with an id greater than this (the last
+                id of the previous page)
+            limit: Maximum number of messages to return (all if None)
 
         Returns:
-            List of message dictionaries
+            List of row tuples
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(
-                """
-                SELECT id, session_id, role, content, timestamp, rl_used
-                FROM chat_messages
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """,
-                (session_id,),
-            )
+                cursor.execute(
+                    _SQL_SELECT_SESSION_MESSAGES,
+                    (session_id, after_id, limit if limit is not None else -1),
+                )
 
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
 
-            messages = [dict(row) for row in rows]
-            self.logger.info(f"Retrieved {len(messages)} messages for session {session_id}")
+            self.logger.debug("Retrieved %d messages for session %s", len(rows), session_id)
 
-            return messages
+            return rows
 
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving messages: {e}")
             return []
+
+    def get_session_messages(
+        self, session_id: str, after_id: int = 0, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Get messages for a session in the order they were sent.
+
+        Args:
+            session_id: Session identifier
+            after_id: Only return messages with an id greater than this (the last
+                id of the previous page)
+            limit: Maximum number of messages to return (all if None)
+
+        Returns:
+            List of message dictionaries
+        """
+        rows = self.get_session_message_rows(session_id, after_id=after_id, limit=limit)
+        return [dict(zip(_MESSAGE_FIELDS, row)) for row in rows]
+
+    def get_session_message_contents(self, session_id: str) -> List[Tuple[str, str]]:
+        """
+        Get only the role and content of a session's messages, in order.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of (role, content) tuples
+        """
+        try:
+            with self._pool.acquire(write=False) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(_SQL_SELECT_SESSION_MESSAGE_CONTENTS, (session_id,))
+
+                rows = cursor.fetchall()
+
+            return [(row[0], row[1]) for row in rows]
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error retrieving message contents: {e}")
+            return []
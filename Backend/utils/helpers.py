@@ -1,18 +1,62 @@
 import re
+import string
 from .logger import CustomLogger
 
 # Initialize logger
 logger = CustomLogger()
 
+# HTML tags stripped before summarization
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Keywords that suggest a question is about a listed company
+_STOCK_HINT_RE = re.compile(
+    r"\b(?:stocks?|shares?|prices?|ticker|quotes?|market\s+cap|nse|bse|nasdaq|nyse|"
+    r"sensex|nifty|equity|ipo|dividends?|earnings|valuation|p/?e)\b",
+    re.IGNORECASE,
+)
+# Words of a question, used to look for anything that could name a company
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z&'-]*")
+# Function words and general finance vocabulary. A question made only of these
+# names no company, so symbol extraction is skipped; any other word (in any case)
+# could be a company name and is left to the LLM.
+_GENERIC_WORDS = frozenset("""
+    a about after all also am an and any are as at be before best better between
+    but by can could do does for from get give good great had has have help hey hi
+    how i if in into is it its just know let like me more most much my need no not
+    now of on or our please should so some tell than thank thanks that the their
+    them then there these they this those to too us very vs want was we well were
+    what when where which while who why will with would you your
+    basics beginner beginners benefit benefits calculate choose define definition
+    describe difference differences example examples explain guide idea ideas
+    important learn mean meaning means start started tips understand use used work
+    works
+    account accounts annuity annuities asset assets bond bonds budget budgeting
+    capital cash compound compounding credit debt deposit deposits diversification
+    diversify emergency expense expenses finance finances financial fixed fund
+    funds gold goal goals hedge income index inflation insurance interest invest
+    investing investment investments investor investors loan loans long money
+    mortgage mutual pension personal plan planning portfolio rate rates real
+    recession retirement return returns risk risks save saving savings short sip
+    sips tax taxes term wealth
+    compare current latest today week month year
+    one two three four five six seven eight nine ten hundred thousand lakh lakhs
+    crore crores million billion lot
+    """.split())
+# Unambiguous symbols: uppercase $CASHTAGS (not amounts like "$ten") and
+# exchange-suffixed tickers (RELIANCE.NS, TCS.BO)
+_EXPLICIT_SYMBOL_RE = re.compile(
+    r"\$([A-Z]{1,5})\b|\b([A-Za-z][A-Za-z0-9&-]{0,14}\.(?:NS|BO|ns|bo))\b"
+)
+
 
 def format_message_as_html(message):
     """
     Format the message into HTML-friendly format
     Converts newlines to <br> tags
     """
-    logger.info(f"Formatting message as HTML (input length: {len(message)} chars)")
+    logger.debug("Formatting message as HTML (input length: %d chars)", len(message))
     formatted_message = message.replace("\n", "<br>")
-    logger.info(f"HTML formatting complete (output length: {len(formatted_message)} chars)")
+    logger.debug("HTML formatting complete (output length: %d chars)", len(formatted_message))
     return formatted_message
 
 
@@ -21,8 +65,83 @@ def remove_html_tags(text):
     Remove HTML tags from text for summarization
     Uses regex to strip all HTML tags
     """
-    logger.info(f"Removing HTML tags from text (input length: {len(text)} chars)")
-    clean = re.compile("<.*?>")  # Regex to remove HTML tags
-    cleaned_text = re.sub(clean, "", text)
-    logger.info(f"HTML tags removed (output length: {len(cleaned_text)} chars)")
+    logger.debug("Removing HTML tags from text (input length: %d chars)", len(text))
+    cleaned_text = _HTML_TAG_RE.sub("", text)
+    logger.debug("HTML tags removed (output length: %d chars)", len(cleaned_text))
     return cleaned_text
+
+
+def prescreen_stock_query(question):
+    """
+    Cheap regex pre-screen run before LLM-based stock symbol extraction
+
+    A question is only screened out when it has no stock keyword and every word
+    is generic vocabulary; any other word could be a company name the LLM knows.
+
+    Returns:
+        tuple: (may_be_stock_query boolean, list of explicit symbols)
+        The symbol list is only non-empty when every non-generic word in the
+        question is an explicit symbol, in which case the LLM call can be skipped
+    """
+    explicit_symbols = []
+    for match in _EXPLICIT_SYMBOL_RE.finditer(question):
+        symbol = (match.group(1) or match.group(2)).upper()
+        if symbol not in explicit_symbols:
+            explicit_symbols.append(symbol)
+
+    remainder = _EXPLICIT_SYMBOL_RE.sub(" ", question)
+    has_other_names = any(
+        word.lower().removesuffix("'s") not in _GENERIC_WORDS
+        and not _STOCK_HINT_RE.fullmatch(word)
+        for word in _WORD_RE.findall(remainder)
+    )
+
+    if explicit_symbols and not has_other_names:
+        return True, explicit_symbols
+
+    may_be_stock_query = bool(
+        explicit_symbols or has_other_names or _STOCK_HINT_RE.search(question)
+    )
+    return may_be_stock_query, []
+
+
+class CompiledPromptTemplate:
+    """
+    Drop-in replacement for str.format on prompt templates rendered every request.
+    The template is parsed once; format() only joins the literal text with the
+    field values. Templates using positional fields, attribute/index access,
+    conversions or format specs fall back to str.format.
+    """
+
+    def __init__(self, template):
+        self.template = template or ""
+        self._segments = []  # (is_literal, text or field name)
+        self._simple = True
+
+        try:
+            parsed = list(string.Formatter().parse(self.template))
+        except ValueError:
+            # Malformed template: let str.format raise at render time, as before
+            parsed = []
+            self._simple = False
+
+        for literal, field_name, format_spec, conversion in parsed:
+            if literal:
+                self._segments.append((True, literal))
+            if field_name is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                self._simple = False
+                break
+            self._segments.append((False, field_name))
+
+    def __bool__(self):
+        return bool(self.template)
+
+    def format(self, **fields):
+        """Render the template; raises KeyError for a missing field like str.format"""
+        if not self._simple:
+            return self.template.format(**fields)
+        return "".join(
+            [text if is_literal else format(fields[text]) for is_literal, text in self._segments]
+        )
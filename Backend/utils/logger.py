@@ -1,20 +1,74 @@
-import datetime
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+
+LOG_FORMAT = "[%(asctime)s] [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _get_base_logger() -> logging.Logger:
+    """
+    Return the shared application logger, configuring it on first use.
+
+    Records are put on a queue by the calling thread and written to stdout by a
+    background QueueListener, so request threads never block on the stream.
+    The level is taken from the LOG_LEVEL environment variable (default INFO).
+    """
+    global _listener
+    base_logger = logging.getLogger("chatbot")
+
+    with _listener_lock:
+        if _listener is None:
+            log_queue = queue.SimpleQueue()
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+
+            _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+
+            base_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            base_logger.propagate = False
+
+            level = os.getenv("LOG_LEVEL", "INFO").upper()
+            try:
+                base_logger.setLevel(level)
+            except ValueError:
+                base_logger.setLevel(logging.INFO)
+                base_logger.warning("Unknown LOG_LEVEL '%s', using INFO", level)
+
+    return base_logger
 
 
 class CustomLogger:
-    def _log(self, level, message):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        filename = os.path.basename(sys._getframe(2).f_code.co_filename)
-        line_number = sys._getframe(2).f_lineno
-        print(f"[{timestamp}] [{level}] [{filename}:{line_number}] {message}")
+    """
+    Thin wrapper around the shared stdlib logger.
+
+    Messages accept %-style arguments, which are only formatted when the level
+    is enabled: logger.debug("Prompt length: %d", len(prompt))
+    """
+
+    def __init__(self):
+        self._logger = _get_base_logger()
+
+    def isEnabledFor(self, level) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, message, *args):
+        self._logger.debug(message, *args, stacklevel=2)
 
-    def info(self, message):
-        self._log("INFO", message)
+    def info(self, message, *args):
+        self._logger.info(message, *args, stacklevel=2)
 
-    def error(self, message):
-        self._log("ERROR", message)
+    def error(self, message, *args):
+        self._logger.error(message, *args, stacklevel=2)
 
-    def warning(self, message):
-        self._log("WARNING", message)
+    def warning(self, message, *args):
+        self._logger.warning(message, *args, stacklevel=2)
@@ -0,0 +1,199 @@
+"""
+Semantic Response Cache
+Serves answers for paraphrased questions using sentence embedding similarity
+"""
+
+import os
+import pickle
+import threading
+import numpy as np
+from .logger import CustomLogger
+
+
+class SemanticCache:
+    """
+    In-memory cache of (question embedding, response payload) pairs.
+    A lookup is a hit when the cosine similarity between the new question and
+    a cached question reaches the configured threshold.
+    """
+
+    def __init__(self, config, logger: CustomLogger):
+        self.logger = logger
+        self.config = config
+
+        self.logger.info("Initializing Semantic Cache")
+
+        # Get configuration
+        self.enabled = config.get("semantic_cache.enabled", False)
+        self.embed_model_name = config.get(
+            "semantic_cache.embedding_model", "all-MiniLM-L6-v2"
+        )
+        self.threshold = config.get("semantic_cache.similarity_threshold", 0.92)
+        self.max_entries = config.get("semantic_cache.max_entries", 5000)
+
+        self.logger.info(
+            f"Configuration - Enabled: {self.enabled}, Model: {self.embed_model_name}, "
+            f"Threshold: {self.threshold}, Max entries: {self.max_entries}"
+        )
+
+        # Cache file setup (shares the reward model's data directory)
+        self.model_dir = os.path.join(os.path.dirname(__file__), "model_data")
+        self.cache_path = os.path.join(self.model_dir, "semantic_cache.pkl")
+
+        self.embed_model = None
+        # Ring buffer of L2-normalised embeddings: (max_entries, dim), allocated on
+        # the first insert. Rows [0, _count) are in use and _next is the slot the
+        # next entry overwrites, so the oldest entry is dropped in place.
+        self._embeddings = None
+        self._payloads = []  # payload of each used row, same index as _embeddings
+        self._count = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self._initialize_model()
+
+    def _initialize_model(self):
+        """Load the sentence transformer and any persisted cache entries"""
+        try:
+            # Import here to avoid issues if not installed yet
+            from sentence_transformers import SentenceTransformer
+
+            self.logger.info(f"Loading sentence transformer model: {self.embed_model_name}")
+            self.embed_model = SentenceTransformer(self.embed_model_name)
+            self.logger.info("Sentence transformer model loaded successfully")
+        except Exception as e:
+            self.logger.error(f"Failed to load semantic cache model: {e}")
+            self.logger.warning("Semantic cache disabled")
+            self.enabled = False
+            return
+
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, "rb") as f:
+                    saved_data = pickle.load(f)
+                self._load_entries(saved_data["embeddings"], saved_data["payloads"])
+                self.logger.info(f"Loaded {self._count} semantic cache entries")
+            except Exception as e:
+                self.logger.error(f"Error loading semantic cache from {self.cache_path}: {e}")
+                self._embeddings, self._payloads = None, []
+                self._count = self._next = 0
+
+    def _load_entries(self, embeddings, payloads):
+        """Fill the ring buffer from saved entries (oldest first), keeping the newest"""
+        embeddings = np.asarray(embeddings)[-self.max_entries:]
+        payloads = list(payloads)[-self.max_entries:]
+        count = len(payloads)
+
+        self._embeddings = np.empty((self.max_entries, embeddings.shape[1]), dtype=embeddings.dtype)
+        self._embeddings[:count] = embeddings
+        self._payloads = payloads
+        self._count = count
+        self._next = count % self.max_entries
+
+    def embed(self, question: str):
+        """
+        Compute the normalised embedding used for lookups and inserts.
+
+        Returns:
+            1-D numpy array, or None if the cache is disabled
+        """
+        if not self.enabled:
+            return None
+        try:
+            return self.embed_model.encode(
+                question, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+            )
+        except Exception as e:
+            self.logger.error(f"Error embedding question for semantic cache: {e}")
+            return None
+
+    def lookup(self, embedding):
+        """
+        Find the cached payload most similar to embedding.
+
+        Args:
+            embedding: Embedding returned by embed()
+
+        Returns:
+            Cached payload dictionary on a hit, None otherwise
+        """
+        if embedding is None:
+            return None
+
+        with self._lock:
+            if not self._count:
+                return None
+
+            # Embeddings are normalised, so the dot product is the cosine similarity
+            similarities = self._embeddings[: self._count] @ embedding
+            best = int(np.argmax(similarities))
+            score = float(similarities[best])
+            payload = self._payloads[best]
+
+        if score >= self.threshold:
+            self.logger.info("Semantic cache hit (similarity: %.4f)", score)
+            return payload
+
+        self.logger.debug("Semantic cache miss (best similarity: %.4f)", score)
+        return None
+
+    def add(self, embedding, payload: dict):
+        """
+        Store a response payload under the given question embedding.
+
+        Args:
+            embedding: Embedding returned by embed()
+            payload: JSON-serialisable response data to return on future hits
+        """
+        if embedding is None:
+            return
+
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.empty(
+                    (self.max_entries, embedding.shape[0]), dtype=embedding.dtype
+                )
+
+            # Write in place; once the cache is full this overwrites the oldest entry
+            slot = self._next
+            self._embeddings[slot] = embedding
+            if slot < len(self._payloads):
+                self._payloads[slot] = payload
+            else:
+                self._payloads.append(payload)
+            self._next = (slot + 1) % self.max_entries
+            self._count = min(self._count + 1, self.max_entries)
+
+    def save(self):
+        """Persist cache entries to disk"""
+        if not self.enabled or not self._count:
+            return
+
+        try:
+            os.makedirs(self.model_dir, exist_ok=True)
+            with self._lock:
+                # Saved oldest first; a full ring's oldest entry is at _next
+                start = self._next if self._count == self.max_entries else 0
+                order = np.roll(np.arange(self._count), -start)
+                saved_data = {
+                    "embeddings": self._embeddings[order],
+                    "payloads": [self._payloads[i] for i in order],
+                }
+            with open(self.cache_path, "wb") as f:
+                pickle.dump(saved_data, f)
+            self.logger.info(
+                f"Semantic cache saved to {self.cache_path} ({len(saved_data['payloads'])} entries)"
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving semantic cache: {e}")
+            self.logger.error(f"Error type: {type(e).__name__}")
+
+    def stats(self) -> dict:
+        """Get semantic cache statistics"""
+        return {
+            "enabled": self.enabled,
+            "size": self._count,
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.threshold,
+        }
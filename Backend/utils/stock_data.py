@@ -2,6 +2,7 @@ import yfinance as yf
 from typing import Dict, Optional, List
 from datetime import datetime
 from .logger import CustomLogger
+from .cache import TTLCache
 
 
 class StockDataFetcher:
@@ -10,14 +11,17 @@ class StockDataFetcher:
     Provides real-time quotes, company info, and historical data.
     """
 
-    def __init__(self, logger: CustomLogger):
+    def __init__(self, logger: CustomLogger, cache_ttl: float = 60, cache_size: int = 1024):
         """
         Initialize the stock data fetcher.
 
         Args:
             logger: Optional logger instance for logging operations
+            cache_ttl: Seconds a formatted stock context is reused for
+            cache_size: Maximum number of cached (symbol, include_historical) contexts
         """
         self.logger = logger
+        self._context_cache = TTLCache(max_size=cache_size, ttl=cache_ttl)
 
     def _get_exchange_from_symbol(self, symbol: str) -> str:
         """Determine the exchange from the symbol suffix."""
@@ -193,6 +197,8 @@ class StockDataFetcher:
     def format_stock_context(self, symbol: str, include_historical: bool = True) -> str:
         """
         Format stock data into a context string for LLM.
+        Results are cached for cache_ttl seconds, since quotes change at
+        minute granularity; failed fetches are not cached.
 
         Args:
             symbol: Stock ticker symbol
@@ -201,6 +207,23 @@ class StockDataFetcher:
         Returns:
             Formatted string with stock information
         """
+        key = (symbol, include_historical)
+        context = self._context_cache.get(key)
+        if context is not None:
+            self.logger.debug("Using cached stock context for %s", symbol)
+            return context
+
+        context = self._build_stock_context(symbol, include_historical)
+        if not context.startswith("Unable to fetch"):
+            self._context_cache.set(key, context)
+        return context
+
+    def cache_stats(self) -> Dict:
+        """Get stock context cache statistics"""
+        return self._context_cache.stats()
+
+    def _build_stock_context(self, symbol: str, include_historical: bool) -> str:
+        """Fetch stock data and format it into a context string (uncached)."""
         self.logger.info(
             f"Formatting stock context for {symbol} (historical: {include_historical})"
         )